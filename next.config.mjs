@@ -1,3 +1,4 @@
+import fs from 'fs';
 import withPWA from 'next-pwa';
 
 const nextConfig = {
@@ -5,11 +6,23 @@ const nextConfig = {
   turbopack: {}, // Silence Turbopack warning
 };
 
+// Built by scripts/build-precache-manifest.py: content-hashed, budgeted
+// entries for public/. Without it, fall back to next-pwa's default of
+// precaching everything in public/.
+const PRECACHE_MANIFEST = 'public/precache-manifest.json';
+const precache = fs.existsSync(PRECACHE_MANIFEST)
+  ? JSON.parse(fs.readFileSync(PRECACHE_MANIFEST, 'utf-8')).precache
+  : null;
+
 const pwaConfig = withPWA({
   dest: 'public',
   register: true,
   skipWaiting: true,
   disable: process.env.NODE_ENV === 'development',
+  ...(precache && {
+    publicExcludes: ['!**/*'],
+    additionalManifestEntries: precache,
+  }),
 });
 
 export default pwaConfig(nextConfig);
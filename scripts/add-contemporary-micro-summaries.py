@@ -3,11 +3,11 @@
 Add micro summaries for Contemporary artworks
 """
 from supabase import create_client
+from artwork_changeset import ArtworkChangeset
+import os
 
-SUPABASE_URL = "https://wyanldczdzjmmqjtobcv.supabase.co"
-SUPABASE_KEY = "sb_secret_KfMFAgEr_9kcdhVngyUvWA_V3MzjGqR"
-
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
 
 # Micro summaries based on the artwork descriptions and artist biographies
 micro_summaries = {
@@ -68,32 +68,26 @@ micro_summaries = {
     '2013.443A-E': "Roy Lichtenstein's monumental sculpture transforms the spontaneous gesture of a brushstroke into frozen, depersonalized forms. The five towering elements ironically comment on Abstract Expressionism while celebrating Pop Art's transformation of artistic gestures into public monuments."
 }
 
-print("=" * 80)
-print("ADDING MICRO SUMMARIES TO CONTEMPORARY ARTWORKS")
-print("=" * 80)
-
-updated = 0
-skipped = 0
-
-for accession, summary in micro_summaries.items():
-    try:
-        result = supabase.table('Artworks').update({
-            'Micro Summary': summary
-        }).eq('Accession Number', accession).execute()
-
-        if result.data:
-            print(f"OK {accession:15s} - Updated")
-            updated += 1
-        else:
-            print(f"  {accession:15s} - Not found")
-            skipped += 1
-    except Exception as e:
-        print(f"X {accession:15s} - Error: {e}")
-        skipped += 1
-
-print("\n" + "=" * 80)
-print("SUMMARY")
-print("=" * 80)
-print(f"OK Updated: {updated} artworks")
-print(f"  Skipped: {skipped} artworks")
-print(f"  Total: {len(micro_summaries)} summaries")
+
+def contribute(changeset, supabase):
+    for accession, summary in micro_summaries.items():
+        changeset.set(accession, 'Micro Summary', summary, source='micro-summaries')
+
+
+if __name__ == '__main__':
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+    print("=" * 80)
+    print("ADDING MICRO SUMMARIES TO CONTEMPORARY ARTWORKS")
+    print("=" * 80)
+
+    changeset = ArtworkChangeset()
+    contribute(changeset, supabase)
+    updated, not_found, failed = changeset.flush(supabase)
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"OK Updated: {updated} artworks")
+    print(f"  Skipped: {not_found + failed} artworks")
+    print(f"  Total: {len(micro_summaries)} summaries")
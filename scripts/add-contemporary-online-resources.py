@@ -4,12 +4,12 @@ Add curated online resources for Contemporary artworks
 High-quality sources: MoMA, Guggenheim, Tate, Getty, etc.
 """
 from supabase import create_client
+from artwork_changeset import ArtworkChangeset
 import json
+import os
 
-SUPABASE_URL = "https://wyanldczdzjmmqjtobcv.supabase.co"
-SUPABASE_KEY = "sb_secret_KfMFAgEr_9kcdhVngyUvWA_V3MzjGqR"
-
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
 
 # Online resources organized by accession number
 online_resources = {
@@ -527,32 +527,26 @@ online_resources = {
     ]
 }
 
-print("=" * 80)
-print("ADDING ONLINE RESOURCES TO CONTEMPORARY ARTWORKS")
-print("=" * 80)
 
-updated = 0
-skipped = 0
+def contribute(changeset, supabase):
+    for accession, resources in online_resources.items():
+        changeset.set(accession, 'Online Resources', resources, source='online-resources')
+
+
+if __name__ == '__main__':
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
-for accession, resources in online_resources.items():
-    try:
-        result = supabase.table('Artworks').update({
-            'Online Resources': resources
-        }).eq('Accession Number', accession).execute()
+    print("=" * 80)
+    print("ADDING ONLINE RESOURCES TO CONTEMPORARY ARTWORKS")
+    print("=" * 80)
 
-        if result.data:
-            print(f"OK {accession:15s} - Added {len(resources)} resources")
-            updated += 1
-        else:
-            print(f"  {accession:15s} - Not found")
-            skipped += 1
-    except Exception as e:
-        print(f"X {accession:15s} - Error: {e}")
-        skipped += 1
+    changeset = ArtworkChangeset()
+    contribute(changeset, supabase)
+    updated, not_found, failed = changeset.flush(supabase)
 
-print("\n" + "=" * 80)
-print("SUMMARY")
-print("=" * 80)
-print(f"OK Updated: {updated} artworks")
-print(f"  Skipped: {skipped} artworks")
-print(f"  Total resources added: {sum(len(r) for r in online_resources.values())}")
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"OK Updated: {updated} artworks")
+    print(f"  Skipped: {not_found + failed} artworks")
+    print(f"  Total resources added: {sum(len(r) for r in online_resources.values())}")
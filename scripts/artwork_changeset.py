@@ -0,0 +1,86 @@
+"""
+Coalesce column updates from several maintenance jobs into one write per artwork
+
+Jobs call changeset.set(accession, column, value, source=...) instead of
+updating Supabase directly; flush() then sends a single PATCH per row with
+every column that changed. When two jobs write different values to the same
+column of the same row, the last writer wins and the clash is recorded in
+changeset.conflicts (or raised, with strict=True).
+"""
+from profiling import phase
+import importlib.util
+import os
+
+
+class ChangesetConflict(Exception):
+    pass
+
+
+class ArtworkChangeset:
+    def __init__(self, key_column='Accession Number', table='Artworks', strict=False):
+        self.key_column = key_column
+        self.table = table
+        self.strict = strict
+        self.rows = {}       # key -> {column: (value, source)}
+        self.conflicts = []  # (key, column, (old_value, old_source), (new_value, new_source))
+
+    def set(self, key, column, value, source):
+        row = self.rows.setdefault(key, {})
+        previous = row.get(column)
+        if previous is not None and previous[0] != value and previous[1] != source:
+            conflict = (key, column, previous, (value, source))
+            if self.strict:
+                raise ChangesetConflict(
+                    f"{key} / {column}: {previous[1]} and {source} disagree")
+            self.conflicts.append(conflict)
+        row[column] = (value, source)
+
+    def update(self, key, values, source):
+        for column, value in values.items():
+            self.set(key, column, value, source)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def report_conflicts(self):
+        for key, column, (_, old_source), (_, new_source) in self.conflicts:
+            print(f"! {key:15s} - {column}: {old_source} overwritten by {new_source}")
+
+    def flush(self, supabase):
+        """Write each pending row once. Returns (updated, not_found, failed)."""
+        self.report_conflicts()
+
+        updated = 0
+        not_found = 0
+        failed = 0
+
+        for key, row in self.rows.items():
+            values = {column: value for column, (value, _) in row.items()}
+            columns = ', '.join(values)
+            try:
+                with phase('write'):
+                    result = supabase.table(self.table).update(values).eq(
+                        self.key_column, key).execute()
+
+                if result.data:
+                    print(f"OK {key:15s} - Updated {columns}")
+                    updated += 1
+                else:
+                    print(f"  {key:15s} - Not found")
+                    not_found += 1
+            except Exception as e:
+                print(f"X {key:15s} - Error: {e}")
+                failed += 1
+
+        self.rows.clear()
+        return updated, not_found, failed
+
+
+def load_script(filename):
+    """Import a sibling maintenance script (whose name has dashes) as a module."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    name = os.path.splitext(filename)[0].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped JSONL artwork store with an offset index
+
+An alternative to json.load()ing the whole artworks.json: records are
+stored one compact JSON object per line (<name>.jsonl), with a sidecar
+index (<name>.idx.json) mapping id, Accession Number and Collection to
+byte ranges. Reads go through mmap, so a lookup or filtered scan decodes
+only the records it touches.
+
+Stores live under data/ at the repo root, outside public/, so they are
+never served or precached.
+
+    store = ArtworkStore('data/artworks.jsonl')
+    store.get('42')
+    store.by_accession('67.8')
+    for artwork in store.filter('Collection', 'Contemporary'): ...
+
+Convert an existing export (writes data/artworks.jsonl):
+
+    python scripts/artwork_store.py public/data/artworks.json
+
+The index records the data file's size, mtime and SHA-1. Opening a store
+whose data no longer matches its index raises StaleIndexError; when only
+the mtime differs (a copy or checkout), the SHA-1 decides.
+"""
+from fileio import file_digest, write_atomic
+import hashlib
+import json
+import mmap
+import os
+import sys
+
+STORE_DIR = 'data'
+UNIQUE_KEYS = ('id', 'Accession Number')
+GROUP_KEYS = ('Collection',)
+
+
+class StaleIndexError(Exception):
+    pass
+
+
+def index_path(path):
+    return os.path.splitext(path)[0] + '.idx.json'
+
+
+def write_store(artworks, path):
+    """Write artworks as <path> (JSONL) plus its offset index."""
+    lines = []
+    index = {key: {} for key in UNIQUE_KEYS + GROUP_KEYS}
+    offset = 0
+    for artwork in artworks:
+        line = json.dumps(artwork, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        span = [offset, len(line) - 1]
+        for key in UNIQUE_KEYS:
+            if artwork.get(key):
+                index[key][str(artwork[key])] = span
+        for key in GROUP_KEYS:
+            index[key].setdefault(str(artwork.get(key) or ''), []).append(span)
+        lines.append(line)
+        offset += len(line)
+
+    # Data first: an index that does not describe the data is treated as stale
+    data = b''.join(lines)
+    write_atomic(path, data)
+    index['count'] = len(lines)
+    index['size'] = offset
+    index['mtime'] = os.stat(path).st_mtime_ns
+    index['sha1'] = hashlib.sha1(data).hexdigest()
+    write_atomic(index_path(path), json.dumps(index, ensure_ascii=False).encode('utf-8'))
+
+
+class ArtworkStore:
+    def __init__(self, path):
+        self.path = path
+        with open(index_path(path), encoding='utf-8') as f:
+            self.index = json.load(f)
+        self._file = open(path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        size = stat.st_size
+        if size != self.index['size']:
+            self._file.close()
+            raise StaleIndexError(f"{path} is {size} bytes, index expects {self.index['size']}")
+        if stat.st_mtime_ns != self.index.get('mtime') and file_digest(path, 'sha1') != self.index.get('sha1'):
+            self._file.close()
+            raise StaleIndexError(f"{path} content does not match its index")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def close(self):
+        if self._map:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.index['count']
+
+    def _read(self, span):
+        offset, length = span
+        return json.loads(self._map[offset:offset + length])
+
+    def get(self, artwork_id):
+        span = self.index['id'].get(str(artwork_id))
+        return self._read(span) if span else None
+
+    def by_accession(self, accession):
+        span = self.index['Accession Number'].get(accession)
+        return self._read(span) if span else None
+
+    def filter(self, key, value):
+        """Yield records whose indexed group key (see GROUP_KEYS) equals value."""
+        if key not in GROUP_KEYS:
+            raise ValueError(f"filter() needs one of {GROUP_KEYS}, not {key!r}; use get()/by_accession()")
+        for span in self.index[key].get(value or '', []):
+            yield self._read(span)
+
+    def __iter__(self):
+        start = 0
+        while start < len(self._map):
+            end = self._map.find(b'\n', start)
+            yield json.loads(self._map[start:end])
+            start = end + 1
+
+
+def convert(source, target_dir=STORE_DIR):
+    """artworks.json -> <target_dir>/artworks.jsonl + artworks.idx.json."""
+    with open(source, encoding='utf-8') as f:
+        artworks = json.load(f)
+    name = os.path.splitext(os.path.basename(source))[0]
+    target = os.path.join(target_dir, name + '.jsonl')
+    write_store(artworks, target)
+    return target, len(artworks)
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else 'public/data/artworks.json'
+    target, count = convert(source)
+    print(f"OK Wrote {count} artworks to {target} (index: {index_path(target)})")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Build the service-worker precache manifest for public/
+
+Walks public/, content-hashes every asset and writes
+public/precache-manifest.json with Workbox-style {url, revision} entries.
+Clients re-download only the assets whose revision changed.
+
+next.config.mjs hands these entries to next-pwa (additionalManifestEntries)
+and excludes public/ from next-pwa's own precache, so this manifest is the
+only way public/ files get precached. `npm run build` runs it first
+(prebuild), so revisions always match the files being shipped; the
+manifest is a build artifact and is not committed.
+
+Assets are ranked (data, then UI sprites/logos, then thumbnails) and
+precached in that order. Filling stops at the first asset that does not fit
+the byte budget, so a lower tier never takes space ahead of a higher one;
+that asset and everything after it are listed under "deferred" and left to
+runtime caching, as are high-resolution images and other large files.
+
+Hashes are cached in .precache-cache.json by (size, mtime), so unchanged
+files are never re-read.
+"""
+from fileio import file_digest
+import argparse
+import fnmatch
+import json
+import os
+import re
+
+PUBLIC_DIR = 'public'
+MANIFEST_FILE = 'public/precache-manifest.json'
+HASH_CACHE_FILE = '.precache-cache.json'
+
+DEFAULT_BUDGET_MB = 25
+THUMBNAIL_MAX_BYTES = 150 * 1024
+THUMBNAIL_MAX_TILE_LEVEL = 8  # Deep Zoom level 8 is at most 256px across
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg')
+
+# App shell assets precached ahead of thumbnails; everything else is tiered by size
+UI_ASSETS = {
+    'images/sprites.webp',
+    'icon-192x192.png',
+    'icon-512x512.png',
+    'favicon.ico',
+}
+
+# Build output and tooling files that must never be precached
+EXCLUDE = [
+    'precache-manifest.json',
+    'sw.js',
+    'sw.js.map',
+    'workbox-*.js',
+    'workbox-*.js.map',
+    'tiles/*/meta.json',
+]
+
+# Lower tier is precached first
+TIER_DATA = 0
+TIER_UI = 1
+TIER_THUMBNAIL = 2
+TIER_OTHER = 3
+TIER_NAMES = {TIER_DATA: 'data', TIER_UI: 'ui', TIER_THUMBNAIL: 'thumbnail', TIER_OTHER: 'other'}
+
+TILE_LEVEL = re.compile(r'^tiles/[^/]+/image_files/(\d+)/')
+
+
+def tier_for(rel_path, size):
+    if rel_path.startswith('data/') or rel_path == 'manifest.json' or rel_path.endswith('.dzi'):
+        return TIER_DATA
+    if rel_path in UI_ASSETS:
+        return TIER_UI
+    match = TILE_LEVEL.match(rel_path)
+    if match:
+        return TIER_THUMBNAIL if int(match.group(1)) <= THUMBNAIL_MAX_TILE_LEVEL else TIER_OTHER
+    if rel_path.lower().endswith(IMAGE_EXTENSIONS) and size <= THUMBNAIL_MAX_BYTES:
+        return TIER_THUMBNAIL
+    return TIER_OTHER
+
+
+def load_hash_cache():
+    if not os.path.exists(HASH_CACHE_FILE):
+        return {}
+    with open(HASH_CACHE_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def walk_public():
+    for root, dirs, files in os.walk(PUBLIC_DIR):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            rel_path = os.path.relpath(path, PUBLIC_DIR).replace(os.sep, '/')
+            if any(fnmatch.fnmatch(rel_path, pattern) for pattern in EXCLUDE):
+                continue
+            yield path, rel_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the service-worker precache manifest')
+    parser.add_argument('--budget-mb', type=float, default=DEFAULT_BUDGET_MB,
+                        help=f'precache byte budget in MB (default {DEFAULT_BUDGET_MB})')
+    args = parser.parse_args()
+    budget = int(args.budget_mb * 1024 * 1024)
+
+    print("=" * 80)
+    print("BUILDING PRECACHE MANIFEST")
+    print("=" * 80)
+
+    cache = load_hash_cache()
+    new_cache = {}
+    assets = []
+    rehashed = 0
+
+    for path, rel_path in walk_public():
+        stat = os.stat(path)
+        cached = cache.get(rel_path)
+        if cached and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime_ns:
+            revision = cached['hash']
+        else:
+            revision = file_digest(path, 'md5')
+            rehashed += 1
+        new_cache[rel_path] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'hash': revision}
+        assets.append({
+            'url': '/' + rel_path,
+            'revision': revision,
+            'size': stat.st_size,
+            'tier': tier_for(rel_path, stat.st_size),
+        })
+
+    # Cheapest-first within a tier so the budget covers as many assets as possible
+    assets.sort(key=lambda a: (a['tier'], a['size'], a['url']))
+
+    precache = []
+    deferred = []
+    used = 0
+    for asset in assets:
+        if not deferred and asset['tier'] != TIER_OTHER and used + asset['size'] <= budget:
+            precache.append(asset)
+            used += asset['size']
+        else:
+            deferred.append(asset)
+
+    previous = {}
+    if os.path.exists(MANIFEST_FILE):
+        with open(MANIFEST_FILE, encoding='utf-8') as f:
+            previous = {e['url']: e['revision'] for e in json.load(f).get('precache', [])}
+    changed = sum(1 for a in precache if previous.get(a['url']) != a['revision'])
+
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'budget': budget,
+            'precacheBytes': used,
+            'precache': [{'url': a['url'], 'revision': a['revision']} for a in precache],
+            'deferred': [a['url'] for a in deferred],
+        }, f, indent=2)
+
+    with open(HASH_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(new_cache, f)
+
+    print(f"\nHashed {rehashed} of {len(assets)} files (rest unchanged)\n")
+    for tier, name in TIER_NAMES.items():
+        tier_assets = [a for a in precache if a['tier'] == tier]
+        tier_bytes = sum(a['size'] for a in tier_assets)
+        print(f"  {name:10s} {len(tier_assets):5d} files  {tier_bytes / 1024 / 1024:8.2f} MB")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"OK Precached: {len(precache)} files, {used / 1024 / 1024:.2f} of {args.budget_mb} MB")
+    print(f"  Changed since last build: {changed}")
+    print(f"  Deferred to runtime cache: {len(deferred)}")
+    print(f"  Manifest: {MANIFEST_FILE}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,21 @@
 #!/usr/bin/env python3
 """
 Extract individual core badges from the combined image
+
+Run with --pack to do the reverse: pack the badges and the docent logo into
+a single sprite atlas (PNG + WebP) with a JSON and CSS coordinate map. The
+app renders them through <Sprite>, so a cold load fetches one image instead
+of one per badge. The individual files live in assets/ and are not served.
 """
-from PIL import Image
+from PIL import Image, ImageChops
+from profiling import phase, profiled
+import argparse
+import json
 import os
 
 # Source image
-source = "A:/docent-pwa/public/core-badges.png"
-output_dir = "A:/docent-pwa/public/images/badges"
-
-# Create output directory
-os.makedirs(output_dir, exist_ok=True)
-
-# Load the source image
-img = Image.open(source)
-width, height = img.size
-print(f"Source image size: {width}x{height}")
+source = "assets/core-badges.png"
+output_dir = "assets/badges"
 
 # Badge positions based on 1536x1024 image
 # Layout appears to be 3 columns x 3 rows with padding
@@ -29,12 +29,180 @@ badges = {
     'european-core.png': (1050, 700, 1520, 990),       # Bottom right - Corinthian columns
 }
 
-print("\nExtracting badges:")
-for name, coords in badges.items():
-    x1, y1, x2, y2 = coords
-    badge = img.crop((x1, y1, x2, y2))
-    output_path = os.path.join(output_dir, name)
-    badge.save(output_path)
-    print(f"  OK {name:30s} - {x2-x1}x{y2-y1} at ({x1},{y1})")
+# Atlas inputs and outputs (relative to the project root)
+atlas_sources = [
+    'assets/badges/american-core.png',
+    'assets/badges/african-core.png',
+    'assets/badges/asian-core.png',
+    'assets/badges/contemporary-core.png',
+    'assets/badges/design-decorative-core.png',
+    'assets/badges/european-core.png',
+    'assets/docent-logo.png',
+]
+atlas_dir = 'public/images'
+atlas_name = 'sprites'
+atlas_url = '/images/sprites'
+atlas_css = 'src/app/sprites.css'
+atlas_json = 'src/lib/sprites.json'
+atlas_padding = 2        # Gap between sprites so filtering never bleeds
+atlas_max_side = 512     # Longest side of each sprite in the atlas
+trim_tolerance = 8       # Max per-channel difference counted as background
+
+
+def extract_badges():
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Load the source image
+    img = Image.open(source)
+    width, height = img.size
+    print(f"Source image size: {width}x{height}")
+
+    print("\nExtracting badges:")
+    for name, coords in badges.items():
+        x1, y1, x2, y2 = coords
+        badge = img.crop((x1, y1, x2, y2))
+        output_path = os.path.join(output_dir, name)
+        badge.save(output_path)
+        print(f"  OK {name:30s} - {x2-x1}x{y2-y1} at ({x1},{y1})")
+
+    print(f"\nAll badges extracted to {output_dir}")
+
+
+def trim(img):
+    """Crop away transparent (or flat corner-colored) borders."""
+    img = img.convert('RGBA')
+    alpha = img.getchannel('A')
+    if alpha.getextrema()[0] < 255:
+        bbox = alpha.point(lambda a: 255 if a > 0 else 0).getbbox()
+    else:
+        # Opaque image: treat the top-left corner color as background
+        rgb = img.convert('RGB')
+        background = Image.new('RGB', img.size, rgb.getpixel((0, 0)))
+        diff = ImageChops.difference(rgb, background)
+        bbox = diff.point(lambda d: 255 if d > trim_tolerance else 0).getbbox()
+    return img.crop(bbox) if bbox else img
+
+
+def shelf_layout(sizes, padding, width):
+    """Place rectangles tallest-first into rows no wider than width."""
+    positions = {}
+    x = y = shelf_height = 0
+    for key, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0])):
+        if x and x + w > width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        positions[key] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h + padding)
+    return y + shelf_height - padding, positions
+
+
+def pack(sizes, padding):
+    """
+    Shelf bin-packing: try every row width from the widest sprite up to a
+    single row and keep the layout with the smallest area (squarest on ties).
+    Returns (atlas_width, atlas_height, {key: (x, y)}).
+    """
+    widest = max(w for w, _ in sizes.values())
+    total = sum(w + padding for w, _ in sizes.values()) - padding
+    best = None
+    for width in range(widest, total + 1):
+        height, positions = shelf_layout(sizes, padding, width)
+        used = max(x + sizes[key][0] for key, (x, _) in positions.items())
+        score = (used * height, abs(used - height))
+        if best is None or score < best[0]:
+            best = (score, used, height, positions)
+    _, width, height, positions = best
+    return width, height, positions
+
+
+def pack_atlas():
+    print("=" * 80)
+    print("PACKING BADGE ATLAS")
+    print("=" * 80)
+
+    sprites = {}
+    for path in atlas_sources:
+        if not os.path.exists(path):
+            print(f"  Skipped {path}: not found")
+            continue
+        name = os.path.splitext(os.path.basename(path))[0]
+        with phase('decode'):
+            img = Image.open(path)
+            img.load()
+        with phase('transform'):
+            img = trim(img)
+            img.thumbnail((atlas_max_side, atlas_max_side), Image.LANCZOS)
+        sprites[name] = img
+        print(f"  OK {name:30s} - {img.width}x{img.height}")
+
+    if not sprites:
+        print("Error: no atlas sources found")
+        exit(1)
+
+    with phase('transform'):
+        width, height, positions = pack(
+            {name: img.size for name, img in sprites.items()}, atlas_padding
+        )
+
+        atlas = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        frames = {}
+        for name, (x, y) in positions.items():
+            img = sprites[name]
+            atlas.paste(img, (x, y))
+            frames[name] = {'x': x, 'y': y, 'w': img.width, 'h': img.height}
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    png_path = os.path.join(atlas_dir, f"{atlas_name}.png")
+    webp_path = os.path.join(atlas_dir, f"{atlas_name}.webp")
+    with phase('encode'):
+        atlas.save(png_path, optimize=True)
+        atlas.save(webp_path, quality=85, method=6)
+
+    with open(atlas_json, 'w', encoding='utf-8') as f:
+        json.dump({
+            'image': f"{atlas_url}.png",
+            'webp': f"{atlas_url}.webp",
+            'width': width,
+            'height': height,
+            'frames': frames,
+        }, f, indent=2)
+
+    # Percentage-based rules so sprites scale with the element's size
+    css = [
+        f".sprite {{ background-image: url('{atlas_url}.png'); background-repeat: no-repeat; }}",
+        f"@supports (background-image: image-set(url('{atlas_url}.webp') type('image/webp'))) {{",
+        f"  .sprite {{ background-image: image-set(url('{atlas_url}.webp') type('image/webp'), url('{atlas_url}.png') type('image/png')); }}",
+        "}",
+    ]
+    for name, frame in frames.items():
+        w, h = frame['w'], frame['h']
+        pos_x = frame['x'] / (width - w) * 100 if width != w else 0
+        pos_y = frame['y'] / (height - h) * 100 if height != h else 0
+        css.append(
+            f".sprite-{name} {{ aspect-ratio: {w} / {h}; "
+            f"background-size: {width / w * 100:.4f}% {height / h * 100:.4f}%; "
+            f"background-position: {pos_x:.4f}% {pos_y:.4f}%; }}"
+        )
+    with open(atlas_css, 'w', encoding='utf-8') as f:
+        f.write("/* Generated by scripts/extract-badges.py --pack; do not edit */\n")
+        f.write("\n".join(css) + "\n")
+
+    print(f"\nAtlas: {width}x{height}, {len(frames)} sprites")
+    print(f"  PNG:  {png_path} ({os.path.getsize(png_path):,} bytes)")
+    print(f"  WebP: {webp_path} ({os.path.getsize(webp_path):,} bytes)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pack', action='store_true',
+                        help='pack badges and logos into a sprite atlas instead of extracting')
+    args = parser.parse_args()
 
-print(f"\nAll badges extracted to {output_dir}")
+    with profiled('extract-badges'):
+        if args.pack:
+            pack_atlas()
+        else:
+            extract_badges()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+File helpers shared by the maintenance scripts
+
+    write_atomic(path, data)         bytes -> temp file, fsync, rename
+    write_json_atomic(path, data)    same, for JSON
+    file_digest(path, 'sha1')        hex digest, read in 1 MB chunks
+    resolve_source(image_url)        local path for an image URL
+
+Atomic writes mean readers (the app, the service worker, another script)
+only ever see the old file or the new one, never a partial write.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import urllib.request
+
+CHUNK_SIZE = 1 << 20
+PUBLIC_DIR = 'public'
+CACHE_DIR = '.image-cache'
+
+
+def write_atomic(path, data):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; exports must be servable
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_json_atomic(path, data, indent=2):
+    write_atomic(path, json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8'))
+
+
+def file_digest(path, algorithm='sha1'):
+    h = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def resolve_source(image_url):
+    """Return a local path for an image URL, downloading remote images once."""
+    if image_url.startswith('/'):
+        return os.path.join(PUBLIC_DIR, image_url.lstrip('/'))
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, hashlib.sha1(image_url.encode()).hexdigest())
+    if not os.path.exists(path):
+        tmp = path + '.part'
+        with urllib.request.urlopen(image_url, timeout=60) as resp, open(tmp, 'wb') as f:
+            for chunk in iter(lambda: resp.read(CHUNK_SIZE), b''):
+                f.write(chunk)
+        os.replace(tmp, path)
+    return path
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Generate Deep Zoom (DZI) tile pyramids for artwork images
+
+Each artwork's "Image URL" is cut into 254px tiles at every zoom level under
+public/tiles/<accession>/, so the viewer only fetches the tiles on screen
+instead of the full original.
+
+- Each image is decoded once; every lower level is made by halving the
+  level above, so a worker holds at most the full image plus one half-size
+  copy (plus the decoded original while converting non-RGB sources).
+- Different images are tiled in parallel across a process pool. Each job's
+  peak memory is estimated from the image header, and jobs only start while
+  the estimates of everything running fit in --max-memory-mb; an image too
+  large for the budget on its own runs alone.
+- Pyramids whose source hash and tiling settings are unchanged are skipped;
+  a rebuilt pyramid starts from an empty directory so no stale tiles remain.
+- Tile-set metadata is written to the artwork's "Deep Zoom" column
+  (supabase/migrations/20261019000100_artworks_deep_zoom.sql), which the
+  artwork page hands to components/DeepZoomViewer.tsx.
+"""
+from concurrent.futures import FIRST_COMPLETED, wait
+from fileio import file_digest, resolve_source
+from PIL import Image
+from profiling import phase, profiled, worker_pool
+from supabase import create_client
+import argparse
+import json
+import math
+import os
+import shutil
+
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+
+TILES_DIR = 'public/tiles'
+TILES_URL = '/tiles'
+
+TILE_SIZE = 254
+OVERLAP = 1
+TILE_FORMAT = 'jpg'
+TILE_QUALITY = 85
+DEFAULT_MAX_MEMORY_MB = 2048
+
+def level_sizes(width, height):
+    """Deep Zoom levels, from 1x1 (level 0) up to full size (max level)."""
+    max_level = math.ceil(math.log2(max(width, height)))
+    return [
+        (max(1, math.ceil(width / 2 ** (max_level - level))),
+         max(1, math.ceil(height / 2 ** (max_level - level))))
+        for level in range(max_level + 1)
+    ]
+
+
+def tile_boxes(width, height):
+    """Yield (col, row, box) for every tile of a level, including overlap."""
+    cols = math.ceil(width / TILE_SIZE)
+    rows = math.ceil(height / TILE_SIZE)
+    for col in range(cols):
+        for row in range(rows):
+            x = col * TILE_SIZE - (OVERLAP if col else 0)
+            y = row * TILE_SIZE - (OVERLAP if row else 0)
+            x2 = min(width, (col + 1) * TILE_SIZE + OVERLAP)
+            y2 = min(height, (row + 1) * TILE_SIZE + OVERLAP)
+            yield col, row, (x, y, x2, y2)
+
+
+def render_pyramid(source, out_dir):
+    """
+    Write every level's tiles for one image, largest level first, deriving
+    each level by halving the one above. Returns (width, height, levels, tiles).
+    """
+    if os.path.exists(out_dir):
+        shutil.rmtree(out_dir)
+
+    img = Image.open(source)
+    img.load()  # Decodes and closes the file
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    width, height = img.size
+    sizes = level_sizes(width, height)
+
+    tiles = 0
+    for level in range(len(sizes) - 1, -1, -1):
+        if img.size != sizes[level]:
+            img = img.resize(sizes[level], Image.LANCZOS)
+        level_dir = os.path.join(out_dir, str(level))
+        os.makedirs(level_dir)
+        for col, row, box in tile_boxes(*img.size):
+            img.crop(box).save(
+                os.path.join(level_dir, f"{col}_{row}.{TILE_FORMAT}"),
+                quality=TILE_QUALITY,
+            )
+            tiles += 1
+    return width, height, len(sizes), tiles
+
+
+def peak_bytes(source):
+    """Estimated peak memory of render_pyramid(), from the header only."""
+    with Image.open(source) as img:
+        width, height = img.size
+        source_bands = 0 if img.mode == 'RGB' else len(img.getbands())
+    # Full RGB level + next level down (1/4 area), plus the original while converting
+    return width * height * (3 * 1.25 + source_bands)
+
+
+def dzi_xml(width, height):
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" '
+        f'TileSize="{TILE_SIZE}" Overlap="{OVERLAP}" Format="{TILE_FORMAT}">\n'
+        f'  <Size Width="{width}" Height="{height}"/>\n'
+        '</Image>\n'
+    )
+
+
+def is_current(meta_path, source_hash):
+    if not os.path.exists(meta_path):
+        return False
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    return (meta.get('sourceHash') == source_hash and
+            meta.get('tileSize') == TILE_SIZE and
+            meta.get('overlap') == OVERLAP and
+            meta.get('format') == TILE_FORMAT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate Deep Zoom tile pyramids for artwork images')
+    parser.add_argument('--collection', help='only tile artworks in this collection')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='most images tiled in parallel')
+    parser.add_argument('--max-memory-mb', type=int, default=DEFAULT_MAX_MEMORY_MB,
+                        help=f'memory budget shared by running workers (default {DEFAULT_MAX_MEMORY_MB})')
+    parser.add_argument('--force', action='store_true', help='rebuild pyramids even if current')
+    parser.add_argument('--no-db', action='store_true', help='do not write "Deep Zoom" metadata to Supabase')
+    args = parser.parse_args()
+
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+    print("=" * 80)
+    print("GENERATING DEEP ZOOM TILES")
+    print("=" * 80)
+
+    query = supabase.table('Artworks').select('ID, "Accession Number", Title, "Image URL"')
+    if args.collection:
+        query = query.eq('Collection', args.collection)
+    artworks = [a for a in query.order('ID').execute().data if a.get('Image URL')]
+    print(f"\nFound {len(artworks)} artworks with images\n")
+
+    generated = 0
+    current = 0
+    failed = 0
+
+    # Hash sources first (cheap, serial) so only stale pyramids are queued
+    pending = []
+    for artwork in artworks:
+        accession = artwork['Accession Number']
+        try:
+            with phase('fetch'):
+                source = resolve_source(artwork['Image URL'])
+                source_hash = file_digest(source, 'sha1')
+                if not args.force and is_current(os.path.join(TILES_DIR, accession, 'meta.json'), source_hash):
+                    current += 1
+                    continue
+                cost = peak_bytes(source)
+        except Exception as e:
+            print(f"X {accession:15s} - Error: {e}")
+            failed += 1
+            continue
+        pending.append((artwork, source, source_hash, cost))
+
+    budget = args.max_memory_mb * 1024 * 1024
+    running = {}  # future -> (artwork, source_hash, cost)
+    in_use = 0
+
+    with phase('encode'), worker_pool(args.workers) as pool:
+        while pending or running:
+            # Admit jobs in order while their estimated peaks fit the budget
+            while pending and len(running) < args.workers and (not running or in_use + pending[0][3] <= budget):
+                artwork, source, source_hash, cost = pending.pop(0)
+                future = pool.submit(render_pyramid, source,
+                                     os.path.join(TILES_DIR, artwork['Accession Number'], 'image_files'))
+                running[future] = (artwork, source_hash, cost)
+                in_use += cost
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                artwork, source_hash, cost = running.pop(future)
+                in_use -= cost
+                accession = artwork['Accession Number']
+                out_dir = os.path.join(TILES_DIR, accession)
+                try:
+                    width, height, levels, tiles = future.result()
+
+                    with open(os.path.join(out_dir, 'image.dzi'), 'w', encoding='utf-8') as f:
+                        f.write(dzi_xml(width, height))
+
+                    meta = {
+                        'url': f"{TILES_URL}/{accession}/image.dzi",
+                        'width': width,
+                        'height': height,
+                        'tileSize': TILE_SIZE,
+                        'overlap': OVERLAP,
+                        'format': TILE_FORMAT,
+                        'levels': levels,
+                        'tiles': tiles,
+                        'sourceHash': source_hash,
+                    }
+                    if not args.no_db:
+                        with phase('write'):
+                            supabase.table('Artworks').update({
+                                'Deep Zoom': meta
+                            }).eq('ID', artwork['ID']).execute()
+
+                    # Written last: a crash mid-pyramid leaves it marked stale
+                    with open(os.path.join(out_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+                        json.dump(meta, f, indent=2)
+
+                    print(f"OK {accession:15s} | {width}x{height} | {levels} levels, {tiles} tiles")
+                    generated += 1
+                except Exception as e:
+                    print(f"X {accession:15s} - Error: {e}")
+                    failed += 1
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"OK Generated: {generated} pyramids")
+    print(f"  Already current: {current}")
+    print(f"  Failed: {failed}")
+    print(f"  Total: {len(artworks)} artworks")
+
+
+if __name__ == '__main__':
+    with profiled('generate-tiles'):
+        main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Harvest image dimensions and placeholders for every artwork image
+
+For each artwork image this records:
+
+    Image Width / Image Height   from the file header
+    Dominant Color               hex color of the most common palette entry
+    Image Blurhash               4x3 BlurHash string for a blurred placeholder
+
+The image analysed is the one the app shows: "Image" when it is a Supabase
+Storage URL, else "Image Upload", else "Image URL" (see display_image()).
+The grids and detail page paint Dominant Color and the decoded BlurHash
+(src/components/ArtworkImage.tsx) until the image arrives. Their image boxes
+are fixed-size, so the dimensions are stored in Artworks only.
+
+Only headers and a reduced-size preview are decoded: JPEG draft mode
+decodes at 1/8 scale. Other formats (PNG, WebP, GIF) have no reduced
+decode, so they are decoded in full only up to MAX_FULL_DECODE_PIXELS and
+skipped (reported as failed) above it. Pillow's decompression-bomb guard
+stays on. Images are processed in a process pool, and results
+are cached by file hash in .image-metadata-cache.json. Values are written
+back to Artworks in one coalesced update per row.
+"""
+from concurrent.futures import as_completed
+from artwork_changeset import ArtworkChangeset
+from fileio import file_digest, resolve_source
+from PIL import Image
+from profiling import phase, profiled, worker_pool
+from supabase import create_client
+import argparse
+import json
+import math
+import os
+
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+
+CACHE_FILE = '.image-metadata-cache.json'
+PREVIEW_SIZE = 64      # Longest side decoded for color analysis
+BLURHASH_SIZE = 32     # Longest side sampled for the BlurHash
+BLURHASH_COMPONENTS = (4, 3)
+PALETTE_COLORS = 5
+MAX_FULL_DECODE_PIXELS = 24_000_000  # ~72 MB as RGB; non-JPEG inputs only
+
+BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+
+def _base83(value, length):
+    return ''.join(BASE83[(value // 83 ** (length - i)) % 83] for i in range(1, length + 1))
+
+
+def _srgb_to_linear(value):
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value):
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(img, components=BLURHASH_COMPONENTS):
+    """Encode a small RGB image as a BlurHash string."""
+    cx, cy = components
+    width, height = img.size
+    pixels = [tuple(_srgb_to_linear(c) for c in p) for p in img.getdata()]
+    cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(cx)]
+    cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(cy)]
+
+    factors = []
+    for j in range(cy):
+        for i in range(cx):
+            norm = 1 if i == 0 and j == 0 else 2
+            r = g = b = 0.0
+            for y in range(height):
+                row = y * width
+                wy = cos_y[j][y]
+                for x in range(width):
+                    basis = wy * cos_x[i][x]
+                    pr, pg, pb = pixels[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = norm / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((cx - 1) + (cy - 1) * 9, 1)
+    if ac:
+        actual_max = max(abs(v) for f in ac for v in f)
+        quantised_max = max(0, min(82, int(math.floor(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        max_value = 1
+        result += _base83(0, 1)
+
+    result += _base83((_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]), 4)
+
+    def quantise(v):
+        signed = math.copysign(abs(v / max_value) ** 0.5, v)
+        return max(0, min(18, int(math.floor(signed * 9 + 9.5))))
+
+    for r, g, b in ac:
+        result += _base83(quantise(r) * 19 * 19 + quantise(g) * 19 + quantise(b), 2)
+    return result
+
+
+def display_image(artwork):
+    """Same precedence as the thumbnail in fetchArtworks() (src/lib/supabase.ts)."""
+    image = artwork.get('Image') or ''
+    if 'supabase.co' in image:
+        return image
+    return artwork.get('Image Upload') or artwork.get('Image URL') or artwork.get('Image')
+
+
+def analyse(path):
+    """Header dimensions plus color/placeholder from a reduced preview."""
+    with Image.open(path) as img:
+        width, height = img.size
+        if img.format != 'JPEG' and width * height > MAX_FULL_DECODE_PIXELS:
+            raise ValueError(f"{img.format} {width}x{height} needs a full decode; "
+                             f"over the {MAX_FULL_DECODE_PIXELS:,} pixel cap, skipped")
+        # JPEG: decode straight at <=1/8 scale; other formats decode once
+        img.draft('RGB', (PREVIEW_SIZE, PREVIEW_SIZE))
+        preview = img.convert('RGB')
+    preview.thumbnail((PREVIEW_SIZE, PREVIEW_SIZE), Image.BILINEAR)
+
+    palette = preview.quantize(PALETTE_COLORS)
+    count, index = max(palette.getcolors())
+    r, g, b = palette.getpalette()[index * 3:index * 3 + 3]
+
+    sample = preview.copy()
+    sample.thumbnail((BLURHASH_SIZE, BLURHASH_SIZE), Image.BILINEAR)
+
+    return {
+        'Image Width': width,
+        'Image Height': height,
+        'Dominant Color': f"#{r:02x}{g:02x}{b:02x}",
+        'Image Blurhash': blurhash(sample),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Harvest image dimensions and placeholders')
+    parser.add_argument('--collection', help='only artworks in this collection')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='parallel decoders')
+    parser.add_argument('--no-db', action='store_true', help='only fill the local cache')
+    args = parser.parse_args()
+
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+    cache = {}
+    if os.path.exists(CACHE_FILE):
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            cache = json.load(f)
+
+    print("=" * 80)
+    print("HARVESTING IMAGE METADATA")
+    print("=" * 80)
+
+    with phase('fetch'):
+        query = supabase.table('Artworks').select(
+            'ID, "Accession Number", "Image", "Image Upload", "Image URL", '
+            '"Image Width", "Image Height", "Dominant Color", "Image Blurhash"')
+        if args.collection:
+            query = query.eq('Collection', args.collection)
+        artworks = [a for a in query.order('ID').execute().data if display_image(a)]
+    print(f"\nFound {len(artworks)} artworks with images\n")
+
+    hashes = {}
+    failed = 0
+    for artwork in artworks:
+        try:
+            with phase('fetch'):
+                source = resolve_source(display_image(artwork))
+                hashes[artwork['Accession Number']] = (source, file_digest(source, 'sha1'))
+        except Exception as e:
+            print(f"X {artwork['Accession Number']:15s} - Error: {e}")
+            failed += 1
+
+    todo = {digest: source for source, digest in hashes.values() if digest not in cache}
+    print(f"  Cached: {len(hashes) - len(todo)}  To analyse: {len(todo)}\n")
+
+    with phase('transform'), worker_pool(args.workers) as pool:
+        futures = {pool.submit(analyse, source): digest for digest, source in todo.items()}
+        for future in as_completed(futures):
+            digest = futures[future]
+            try:
+                cache[digest] = future.result()
+            except Exception as e:
+                print(f"X {todo[digest]} - Error: {e}")
+                failed += 1
+
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+
+    changeset = ArtworkChangeset()
+    unchanged = 0
+    for artwork in artworks:
+        accession = artwork['Accession Number']
+        if accession not in hashes or hashes[accession][1] not in cache:
+            continue
+        meta = cache[hashes[accession][1]]
+        if all(artwork.get(column) == value for column, value in meta.items()):
+            unchanged += 1
+            continue
+        changeset.update(accession, meta, source='image-metadata')
+
+    updated = not_found = write_failed = 0
+    if not args.no_db:
+        updated, not_found, write_failed = changeset.flush(supabase)
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"OK Updated: {updated} artworks")
+    print(f"  Already current: {unchanged}")
+    print(f"  Failed: {failed + not_found + write_failed}")
+    print(f"  Total: {len(artworks)} artworks")
+
+
+if __name__ == '__main__':
+    with profiled('harvest-image-metadata'):
+        main()
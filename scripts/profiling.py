@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Opt-in CPU and memory profiling for the maintenance scripts
+
+Profile any script without editing it:
+
+    python scripts/profiling.py scripts/extract-badges.py --pack
+    python scripts/profiling.py --sample scripts/generate-tiles.py --no-db
+
+or set DOCENT_PROFILE=cprofile (or =sample) for scripts that wrap their run
+in profiled(). Reports go to profiles/<job>-<timestamp>/:
+
+    cpu.txt      hot functions by cumulative and own time (cProfile)
+    cpu.prof     raw pstats data, for snakeviz and friends
+    samples.txt  hottest stacks and lines (sampling mode)
+    memory.txt   peak RSS of this process and its children (children on
+                 Unix only), plus top allocation sites and growth since
+                 start (tracemalloc)
+    phases.txt   wall time per phase (fetch, transform, write, encode, ...)
+
+Scripts mark phases with `with phase('encode'):`. Phases cost one clock read
+when profiling is off.
+
+cProfile, the sampler and tracemalloc only see the current process, so
+scripts that fan work out to a process pool create it with worker_pool():
+while profiling is active it runs every task inline in this process, and the
+report covers the real work. tracemalloc also misses memory that C
+extensions such as Pillow allocate themselves; peak RSS in memory.txt does
+not.
+"""
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+
+PROFILE_ENV = 'DOCENT_PROFILE'
+PROFILES_DIR = 'profiles'
+TOP_N = 30
+SAMPLE_INTERVAL = 0.005  # seconds
+
+_phase_times = defaultdict(float)
+_phase_counts = Counter()
+_active = False
+
+
+@contextmanager
+def phase(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phase_times[name] += time.perf_counter() - start
+        _phase_counts[name] += 1
+
+
+def active():
+    """True inside a profiled() block that is actually profiling."""
+    return _active
+
+
+class _InlineExecutor:
+    """Executor that runs each task immediately in the calling process."""
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def worker_pool(max_workers=None):
+    """
+    ProcessPoolExecutor for CPU-bound work, or an inline executor while
+    profiling so the profilers see the tasks.
+    """
+    if _active:
+        print("  Profiling: running pool tasks in-process (--workers ignored)", file=sys.stderr)
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+class _Sampler:
+    """Records the main thread's stack every SAMPLE_INTERVAL seconds."""
+
+    def __init__(self, thread_id):
+        self.thread_id = thread_id
+        self.stacks = Counter()
+        self.lines = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.lines[f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"] += 1
+            stack = []
+            while frame is not None:
+                stack.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            self.stacks[' <- '.join(stack[:8])] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def report(self):
+        out = [f"{self.samples} samples every {SAMPLE_INTERVAL * 1000:.0f}ms\n", "HOT LINES"]
+        for line, count in self.lines.most_common(TOP_N):
+            out.append(f"{count / max(self.samples, 1):7.1%}  {line}")
+        out.append("\nHOT STACKS (innermost first)")
+        for stack, count in self.stacks.most_common(TOP_N):
+            out.append(f"{count / max(self.samples, 1):7.1%}  {stack}")
+        return "\n".join(out) + "\n"
+
+
+def _write(out_dir, name, text):
+    with open(os.path.join(out_dir, name), 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _cpu_report(profiler):
+    out = io.StringIO()
+    for sort_key in ('cumulative', 'tottime'):
+        out.write(f"===== sorted by {sort_key} =====\n")
+        pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort_key).print_stats(TOP_N)
+    return out.getvalue()
+
+
+def _peak_rss_mb():
+    """
+    Peak RSS in MB as (self, largest child); either is None when the
+    platform cannot report it. Windows has no resource module and no
+    per-child peak, so only its own peak working set is read.
+    """
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_working_set_mb(), None
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    unit = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit)
+
+
+def _windows_peak_working_set_mb():
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD),
+                        ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t),
+                        ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t),
+                        ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize / 1024 / 1024
+    except (AttributeError, OSError):
+        return None
+
+
+def _memory_report(baseline, snapshot):
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    snapshot = snapshot.filter_traces(filters)
+    current, peak = tracemalloc.get_traced_memory()
+    peak_self, peak_child = _peak_rss_mb()
+    rss = [f"self {peak_self:.1f} MB" if peak_self is not None else "self n/a"]
+    if peak_child is not None:
+        rss.append(f"largest child {peak_child:.1f} MB")
+    out = [f"peak RSS: {', '.join(rss)}",
+           f"tracemalloc (Python objects only, not Pillow/C buffers): "
+           f"current {current / 1024 / 1024:.1f} MB, peak {peak / 1024 / 1024:.1f} MB\n",
+           f"TOP {TOP_N} ALLOCATION SITES"]
+    for stat in snapshot.statistics('lineno')[:TOP_N]:
+        out.append(str(stat))
+    out.append(f"\nTOP {TOP_N} GROWTH SINCE START")
+    for stat in snapshot.compare_to(baseline.filter_traces(filters), 'lineno')[:TOP_N]:
+        out.append(str(stat))
+    return "\n".join(out) + "\n"
+
+
+def _phase_report(total):
+    out = [f"{'phase':20s} {'calls':>7s} {'seconds':>10s} {'share':>7s}"]
+    for name, seconds in sorted(_phase_times.items(), key=lambda item: -item[1]):
+        out.append(f"{name:20s} {_phase_counts[name]:7d} {seconds:10.3f} {seconds / total:7.1%}")
+    out.append(f"{'total':20s} {'':7s} {total:10.3f}")
+    return "\n".join(out) + "\n"
+
+
+@contextmanager
+def profiled(job, mode=None):
+    """
+    Profile the enclosed block when mode (or $DOCENT_PROFILE) is 'cprofile'
+    or 'sample'; otherwise do nothing.
+    """
+    global _active
+    mode = mode or os.environ.get(PROFILE_ENV, '').lower()
+    if mode in ('', '0', 'off'):
+        yield
+        return
+    if mode in ('1', 'on'):
+        mode = 'cprofile'
+
+    out_dir = os.path.join(PROFILES_DIR, f"{job}-{datetime.now():%Y%m%d-%H%M%S}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    _phase_times.clear()
+    _phase_counts.clear()
+    tracemalloc.start(25)
+    baseline = tracemalloc.take_snapshot()
+
+    profiler = sampler = None
+    if mode == 'sample':
+        sampler = _Sampler(threading.get_ident())
+        sampler.start()
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    _active = True
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        total = time.perf_counter() - start
+        _active = False
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(os.path.join(out_dir, 'cpu.prof'))
+            _write(out_dir, 'cpu.txt', _cpu_report(profiler))
+        if sampler:
+            sampler.stop()
+            _write(out_dir, 'samples.txt', sampler.report())
+
+        snapshot = tracemalloc.take_snapshot()
+        _write(out_dir, 'memory.txt', _memory_report(baseline, snapshot))
+        tracemalloc.stop()
+        _write(out_dir, 'phases.txt', _phase_report(total))
+
+        print(f"\nProfile written to {out_dir} ({total:.2f}s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run a maintenance script under the profiler')
+    parser.add_argument('--sample', action='store_true', help='use the sampling profiler instead of cProfile')
+    parser.add_argument('script', help='path to the script to run')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='arguments passed to the script')
+    args = parser.parse_args()
+
+    sys.argv = [args.script] + args.args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    job = os.path.splitext(os.path.basename(args.script))[0]
+
+    # Use the importable module so phases recorded by the script land in the
+    # same tables, and stop scripts that call profiled() from nesting a second run
+    import profiling
+    os.environ[PROFILE_ENV] = 'off'
+    with profiling.profiled(job, 'sample' if args.sample else 'cprofile'):
+        runpy.run_path(args.script, run_name='__main__')
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Run the Contemporary maintenance jobs as one coalesced pass
+
+Micro summaries, online resources and image URLs are collected into a single
+ArtworkChangeset and flushed once, so each artwork gets one update instead of
+one per job. The jobs use the runner's client, so credentials come only from
+NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY.
+"""
+from supabase import create_client
+from artwork_changeset import ArtworkChangeset, load_script
+from profiling import profiled
+import os
+
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+
+supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+with profiled('contemporary-maintenance'):
+    print("=" * 80)
+    print("CONTEMPORARY MAINTENANCE (COALESCED)")
+    print("=" * 80)
+
+    changeset = ArtworkChangeset()
+
+    # The jobs only queue changes; all reads and the flush share this client
+    for script in ('add-contemporary-micro-summaries.py',
+                   'add-contemporary-online-resources.py',
+                   'update-contemporary-images.py'):
+        load_script(script).contribute(changeset, supabase)
+
+    pending = len(changeset)
+    columns = sum(len(row) for row in changeset.rows.values())
+
+    print("\n" + "=" * 80)
+    print("FLUSHING")
+    print("=" * 80)
+
+    updated, not_found, failed = changeset.flush(supabase)
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"OK Updated: {updated} artworks ({columns} column changes in {pending} writes)")
+    print(f"  Not found: {not_found}")
+    print(f"  Failed: {failed}")
+    print(f"  Conflicts: {len(changeset.conflicts)}")
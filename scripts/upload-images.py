@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Upload artwork images to storage under their content hash
+
+Every local image is stored once as <prefix>/<sha256><ext>, so renamed or
+duplicated files never upload twice and existing blobs are skipped.
+Uploads run in parallel with bounded concurrency and retry with backoff.
+
+Progress is recorded in .upload-manifest.json after every file, keyed by
+storage target and then by path, size and mtime: an interrupted run resumes
+where it stopped, a rerun with nothing new finishes without hashing or
+network calls, and switching --bucket, --prefix or target never reuses
+another target's records.
+
+Storage targets:
+    (default)             Supabase Storage bucket --bucket
+    --local-dir DIR       copy into a local directory (tests, dry runs)
+    --http-base URL       HEAD/PUT against an HTTP stand-in
+
+With --update-db (Supabase targets only, since the other targets do not
+produce public URLs), files named after an accession number (as in
+public/images/contemporary) get their "Image URL" set in one coalesced pass.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from artwork_changeset import ArtworkChangeset
+from fileio import file_digest
+import argparse
+import json
+import mimetypes
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+
+DEFAULT_BUCKET = 'artwork-images'
+DEFAULT_PREFIX = 'by-hash'
+MANIFEST_FILE = '.upload-manifest.json'
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+RETRIES = 4
+
+
+class SupabaseStorage:
+    def __init__(self, bucket):
+        from supabase import create_client
+        self.client = create_client(SUPABASE_URL, SUPABASE_KEY)
+        self.bucket = self.client.storage.from_(bucket)
+        self.target = f"supabase:{SUPABASE_URL}/{bucket}"
+
+    def existing(self, prefix):
+        names = set()
+        offset = 0
+        while True:
+            page = self.bucket.list(prefix, {'limit': 1000, 'offset': offset})
+            names.update(f"{prefix}/{entry['name']}" for entry in page)
+            if len(page) < 1000:
+                return names
+            offset += 1000
+
+    def put(self, key, path, content_type):
+        with open(path, 'rb') as f:
+            self.bucket.upload(key, f.read(), {'content-type': content_type, 'upsert': 'true'})
+
+    def url(self, key):
+        return self.bucket.get_public_url(key)
+
+
+class LocalDirStorage:
+    def __init__(self, root):
+        self.root = root
+        self.target = f"local:{os.path.abspath(root)}"
+
+    def existing(self, prefix):
+        directory = os.path.join(self.root, prefix)
+        if not os.path.isdir(directory):
+            return set()
+        return {f"{prefix}/{name}" for name in os.listdir(directory)}
+
+    def put(self, key, path, content_type):
+        target = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = target + '.part'
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, target)
+
+    def url(self, key):
+        return os.path.abspath(os.path.join(self.root, key))
+
+
+class HttpStorage:
+    """Any server that answers HEAD and PUT on <base>/<key>."""
+
+    def __init__(self, base):
+        self.base = base.rstrip('/')
+        self.target = f"http:{self.base}"
+
+    def existing(self, prefix):
+        return set()  # checked per blob in exists()
+
+    def exists(self, key):
+        try:
+            urllib.request.urlopen(urllib.request.Request(self.url(key), method='HEAD'), timeout=30)
+            return True
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return False
+            raise
+
+    def put(self, key, path, content_type):
+        with open(path, 'rb') as f:
+            request = urllib.request.Request(self.url(key), data=f.read(), method='PUT',
+                                             headers={'Content-Type': content_type})
+        urllib.request.urlopen(request, timeout=120)
+
+    def url(self, key):
+        return f"{self.base}/{key}"
+
+
+def find_images(directories):
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    yield os.path.join(root, name).replace(os.sep, '/')
+
+
+class Manifest:
+    """
+    Thread-safe path -> upload record map for one storage target and prefix,
+    saved after every change. Records for other targets are kept untouched.
+    """
+
+    def __init__(self, path, target):
+        self.path = path
+        self.lock = threading.Lock()
+        self.targets = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                # Manifests from before per-target keys cannot be attributed; start over
+                self.targets = json.load(f).get('targets', {})
+        self.entries = self.targets.setdefault(target, {})
+
+    def current(self, path, stat):
+        entry = self.entries.get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry
+        return None
+
+    def record(self, path, entry):
+        with self.lock:
+            self.entries[path] = entry
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'targets': self.targets}, f, indent=2)
+            os.replace(tmp, self.path)
+
+
+def upload_with_retry(storage, key, path):
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    for attempt in range(RETRIES):
+        try:
+            storage.put(key, path, content_type)
+            return
+        except Exception:
+            if attempt == RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Upload artwork images under their content hash')
+    parser.add_argument('dirs', nargs='*', default=['public/images/contemporary'],
+                        help='image directories (default public/images/contemporary)')
+    parser.add_argument('--bucket', default=DEFAULT_BUCKET, help=f'Supabase bucket (default {DEFAULT_BUCKET})')
+    parser.add_argument('--prefix', default=DEFAULT_PREFIX, help=f'key prefix (default {DEFAULT_PREFIX})')
+    parser.add_argument('--local-dir', help='store into a local directory instead of Supabase')
+    parser.add_argument('--http-base', help='store via HEAD/PUT against this base URL instead of Supabase')
+    parser.add_argument('--workers', type=int, default=8, help='concurrent uploads (default 8)')
+    parser.add_argument('--update-db', action='store_true',
+                        help='set "Image URL" on artworks whose accession number matches a file name')
+    args = parser.parse_args()
+    if args.update_db and (args.local_dir or args.http_base):
+        parser.error('--update-db needs a Supabase target; local and HTTP URLs are not public image URLs')
+
+    if args.local_dir:
+        storage = LocalDirStorage(args.local_dir)
+    elif args.http_base:
+        storage = HttpStorage(args.http_base)
+    else:
+        storage = SupabaseStorage(args.bucket)
+    manifest = Manifest(MANIFEST_FILE, f"{storage.target}/{args.prefix}")
+
+    print("=" * 80)
+    print("UPLOADING IMAGES (CONTENT-ADDRESSED)")
+    print("=" * 80)
+
+    images = list(find_images(args.dirs))
+    print(f"\nFound {len(images)} image files")
+
+    # Files whose size and mtime match the manifest are done already
+    pending = []
+    for path in images:
+        if not manifest.current(path, os.stat(path)):
+            pending.append(path)
+    print(f"  Unchanged since last run: {len(images) - len(pending)}")
+
+    existing = storage.existing(args.prefix) if pending else set()
+    uploaded = 0
+    deduped = 0
+    failed = 0
+
+    # The first file to reach a key stores the blob; copies wait for it
+    claims = {}  # key -> Future resolved once the blob is stored
+    claims_lock = threading.Lock()
+
+    def process(path):
+        stat = os.stat(path)
+        digest = file_digest(path, 'sha256')
+        key = f"{args.prefix}/{digest}{os.path.splitext(path)[1].lower()}"
+        with claims_lock:
+            claim = claims.get(key)
+            owner = claim is None
+            if owner:
+                claim = claims[key] = Future()
+        if owner:
+            try:
+                present = key in existing or (hasattr(storage, 'exists') and storage.exists(key))
+                if not present:
+                    upload_with_retry(storage, key, path)
+                claim.set_result(None)
+            except BaseException as e:
+                claim.set_exception(e)
+                raise
+        else:
+            claim.result()  # Re-raises if the first copy failed to upload
+            present = True
+        manifest.record(path, {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'sha256': digest,
+            'key': key,
+            'url': storage.url(key),
+        })
+        return present
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(process, path): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                if future.result():
+                    print(f"  = {path} (already stored)")
+                    deduped += 1
+                else:
+                    print(f"OK {path}")
+                    uploaded += 1
+            except Exception as e:
+                print(f"X {path} - Error: {e}")
+                failed += 1
+
+    if args.update_db:
+        from supabase import create_client
+        changeset = ArtworkChangeset()
+        for path in images:
+            entry = manifest.entries.get(path)
+            if entry:
+                accession = os.path.splitext(os.path.basename(path))[0]
+                changeset.set(accession, 'Image URL', entry['url'], source='upload-images')
+        print("\n" + "=" * 80)
+        print("UPDATING IMAGE URLS")
+        print("=" * 80)
+        changeset.flush(create_client(SUPABASE_URL, SUPABASE_KEY))
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"OK Uploaded: {uploaded} files")
+    print(f"  Already stored (deduplicated): {deduped}")
+    print(f"  Unchanged (manifest): {len(images) - len(pending)}")
+    print(f"  Failed: {failed}")
+    print(f"  Total: {len(images)} files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Keep per-collection artwork exports fresh without full-table syncs
+
+Each poll re-reads only the rows whose --marker-column timestamp is at or
+after the newest marker seen minus --lag seconds. The window overlaps the
+previous poll on purpose: rows sharing the marker's timestamp and rows from
+transactions that commit late are picked up next time, and rows whose
+exported content is unchanged are dropped. Deletes (which no marker sees)
+and any insert the window missed are found by diffing the live ID set
+against the export; that full ID read only happens when the row count
+disagrees with the export, every --reconcile-every polls, and on the first
+poll after a restart. Only the collection shards that actually changed are
+rewritten:
+
+    public/data/artworks/<collection-slug>.json
+    public/data/sync-meta.json   (per-shard counts and versions)
+    data/artworks/<collection-slug>.jsonl (+ .idx.json, see artwork_store.py)
+
+The .jsonl stores are for the scripts, not the app, so they stay out of
+public/ and are never served or precached.
+
+Every file is written to a temp file and renamed into place, so the app
+never reads a half-written export. Records use the same shape as
+fetchArtworks() in src/lib/supabase.ts.
+
+The marker column and its trigger are created by
+supabase/migrations/20261019000000_artworks_updated_at.sql.
+
+Use --local rows.json to run against a local JSON array of raw Artworks
+rows instead of Supabase (for testing); edit the file to simulate changes.
+"""
+from artwork_store import index_path, write_store
+from datetime import datetime, timedelta, timezone
+from fileio import write_json_atomic
+import argparse
+import json
+import os
+import re
+import time
+
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+
+SHARDS_DIR = 'public/data/artworks'
+SYNC_META_FILE = 'public/data/sync-meta.json'
+STORES_DIR = 'data/artworks'
+DEFAULT_MARKER_COLUMN = 'updated_at'
+DEFAULT_LAG = 60  # seconds re-read behind the newest marker
+DEFAULT_RECONCILE_EVERY = 60  # polls between full ID-set checks
+PAGE_SIZE = 1000
+
+
+class SupabaseBackend:
+    def __init__(self, marker_column):
+        from supabase import create_client
+        self.client = create_client(SUPABASE_URL, SUPABASE_KEY)
+        self.marker_column = marker_column
+
+    def _paged(self, columns, since=None):
+        rows = []
+        start = 0
+        while True:
+            query = self.client.table('Artworks').select(columns)
+            if since is not None:
+                query = query.gte(self.marker_column, since.isoformat())
+            page = query.order('ID').range(start, start + PAGE_SIZE - 1).execute().data
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return rows
+            start += PAGE_SIZE
+
+    def changed_since(self, marker):
+        return self._paged('*', since=marker)
+
+    def count(self):
+        """Row count only; no rows are transferred."""
+        return self.client.table('Artworks').select('ID', count='exact').limit(1).execute().count
+
+    def ids(self):
+        return {str(row['ID']) for row in self._paged('ID')}
+
+    def by_ids(self, ids):
+        rows = []
+        ids = sorted(ids)
+        for start in range(0, len(ids), PAGE_SIZE):
+            rows.extend(self.client.table('Artworks').select('*')
+                        .in_('ID', ids[start:start + PAGE_SIZE]).execute().data)
+        return rows
+
+
+class LocalBackend:
+    """Reads raw Artworks rows from a JSON file; for tests and offline runs."""
+
+    def __init__(self, path, marker_column):
+        self.path = path
+        self.marker_column = marker_column
+
+    def _rows(self):
+        with open(self.path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def changed_since(self, since):
+        return [r for r in self._rows()
+                if since is None or (r.get(self.marker_column) is not None and
+                                     parse_timestamp(r[self.marker_column]) >= since)]
+
+    def count(self):
+        return len(self._rows())
+
+    def ids(self):
+        return {str(r['ID']) for r in self._rows()}
+
+    def by_ids(self, ids):
+        return [r for r in self._rows() if str(r['ID']) in ids]
+
+
+def parse_timestamp(value):
+    """PostgREST timestamptz string -> aware datetime."""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def to_artwork(record):
+    """Mirror of the record mapping in fetchArtworks() (src/lib/supabase.ts)."""
+    image = record.get('Image') or ''
+    image_url = (image if 'supabase.co' in image else
+                 record.get('Image Upload') or record.get('Image URL') or record.get('Image'))
+    artwork = {
+        'id': str(record['ID']),
+        'Accession Number': record.get('Accession Number') or '',
+        'Title': record.get('Title') or 'Untitled',
+    }
+    for column in ('Artist First Name', 'Artist Last Name', 'Artist (Display)', 'Collection',
+                   'On Display', 'Date', 'Medium', 'Dimensions', 'Gallery Location',
+                   'Artwork Description', 'Artist Biography', 'Tour Guidance', 'Connections',
+                   'Historical Context', 'Cultural/Philosophical Movements',
+                   'Contemporary Literature', 'Related Poems', 'Period Music Links',
+                   'Supplemental Research Notes', 'Sources/Bibliography', 'Micro Summary'):
+        if record.get(column) is not None:
+            artwork[column] = record[column]
+    artwork['URL'] = record.get('Corrected URL') or record.get('URL')
+    for column in ('Corrected URL', 'Image', 'Image Upload', 'Image URL', 'Dominant Color',
+                   'Image Blurhash', 'Deep Zoom'):
+        if record.get(column) is not None:
+            artwork[column] = record[column]
+    artwork['thumbnail'] = image_url
+    artwork['imageUrl'] = image_url
+    artwork['Online Resources'] = record.get('Online Resources') or []
+    return {k: v for k, v in artwork.items() if v is not None}
+
+
+def shard_slug(collection):
+    slug = re.sub(r'[^a-z0-9]+', '-', (collection or '').lower()).strip('-')
+    return slug or 'uncategorized'
+
+
+class ShardExporter:
+    def __init__(self, backend, lag=DEFAULT_LAG, reconcile_every=DEFAULT_RECONCILE_EVERY):
+        self.backend = backend
+        self.lag = timedelta(seconds=lag)
+        self.reconcile_every = reconcile_every
+        self.polls_since_reconcile = reconcile_every  # reconcile on the first poll after a restart
+        self.shards = {}      # slug -> {id: artwork}
+        self.locations = {}   # id -> slug
+        self.marker = None
+        self.meta = {}
+        self._load()
+
+    def _load(self):
+        """Rebuild in-memory state from the shards already on disk."""
+        if not os.path.exists(SYNC_META_FILE):
+            return
+        with open(SYNC_META_FILE, encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if 'shards' not in self.meta:
+            return
+        for slug in self.meta['shards']:
+            path = os.path.join(SHARDS_DIR, f"{slug}.json")
+            if not os.path.exists(path):
+                self.meta = {}
+                self.shards.clear()
+                self.locations.clear()
+                return
+            with open(path, encoding='utf-8') as f:
+                self.shards[slug] = {a['id']: a for a in json.load(f)}
+            for artwork_id in self.shards[slug]:
+                self.locations[artwork_id] = slug
+        self.marker = self.meta.get('marker')
+
+    def _place(self, artwork, dirty):
+        artwork_id = artwork['id']
+        slug = shard_slug(artwork.get('Collection'))
+        old_slug = self.locations.get(artwork_id)
+        if old_slug and old_slug != slug:
+            del self.shards[old_slug][artwork_id]
+            dirty.add(old_slug)
+        self.shards.setdefault(slug, {})[artwork_id] = artwork
+        self.locations[artwork_id] = slug
+        dirty.add(slug)
+
+    def _apply(self, records, marker, dirty):
+        """Place changed records; returns the newest marker seen."""
+        for record in records:
+            value = record.get(self.backend.marker_column)
+            if value is not None and (marker is None or parse_timestamp(value) > parse_timestamp(marker)):
+                marker = value
+            artwork = to_artwork(record)
+            slug = self.locations.get(artwork['id'])
+            if slug and self.shards[slug][artwork['id']] == artwork:
+                continue  # re-read from the overlap window, nothing new
+            self._place(artwork, dirty)
+        return marker
+
+    def poll(self):
+        """Export rows changed since the last poll. Returns dirty shard slugs."""
+        full = self.meta.get('shards') is None
+        since = None
+        if not full and self.marker is not None:
+            since = parse_timestamp(self.marker) - self.lag
+        count = None if full else self.backend.count()
+        records = self.backend.changed_since(since)
+
+        dirty = set()
+        marker = self._apply(records, self.marker, dirty)
+
+        # Deletes never move a marker, and a row committed later than the lag
+        # window is invisible to it. The full ID set catches both, so it is
+        # read when the row count disagrees and every --reconcile-every polls
+        self.polls_since_reconcile += 1
+        if not full and (count != len(self.locations) or
+                         self.polls_since_reconcile >= self.reconcile_every):
+            self.polls_since_reconcile = 0
+            live = self.backend.ids()
+            missed = live - set(self.locations)
+            if missed:
+                marker = self._apply(self.backend.by_ids(missed), marker, dirty)
+            for artwork_id in set(self.locations) - live:
+                slug = self.locations.pop(artwork_id)
+                del self.shards[slug][artwork_id]
+                dirty.add(slug)
+
+        if dirty or full or marker != self.marker:
+            self.marker = marker
+            self._write(dirty)
+        return dirty
+
+    def _write(self, dirty):
+        version = int(time.time() * 1000)
+        shards_meta = self.meta.get('shards', {})
+
+        for slug in sorted(dirty):
+            artworks = sorted(self.shards[slug].values(), key=lambda a: (len(a['id']), a['id']))
+            path = os.path.join(SHARDS_DIR, f"{slug}.json")
+            store = os.path.join(STORES_DIR, f"{slug}.jsonl")
+            if artworks:
+                write_json_atomic(path, artworks)
+                write_store(artworks, store)
+                shards_meta[slug] = {
+                    'collection': artworks[0].get('Collection'),
+                    'url': f"/data/artworks/{slug}.json",
+                    'artworkCount': len(artworks),
+                    'version': version,
+                }
+            else:
+                del self.shards[slug]
+                shards_meta.pop(slug, None)
+                for stale in (path, store, index_path(store)):
+                    if os.path.exists(stale):
+                        os.remove(stale)
+
+        self.meta = {
+            'lastSync': datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+            'artworkCount': len(self.locations),
+            'version': version,
+            'marker': self.marker,
+            'shards': shards_meta,
+        }
+        write_json_atomic(SYNC_META_FILE, self.meta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incrementally export Artworks into per-collection shards')
+    parser.add_argument('--interval', type=float, default=5, help='seconds between polls (default 5)')
+    parser.add_argument('--once', action='store_true', help='poll once and exit')
+    parser.add_argument('--marker-column', default=DEFAULT_MARKER_COLUMN,
+                        help=f'last-modified timestamp column on Artworks (default {DEFAULT_MARKER_COLUMN})')
+    parser.add_argument('--lag', type=float, default=DEFAULT_LAG,
+                        help=f'seconds to re-read behind the newest marker (default {DEFAULT_LAG})')
+    parser.add_argument('--reconcile-every', type=int, default=DEFAULT_RECONCILE_EVERY,
+                        help=f'polls between full ID-set checks for deletes (default {DEFAULT_RECONCILE_EVERY})')
+    parser.add_argument('--local', metavar='ROWS_JSON', help='read rows from a local JSON file instead of Supabase')
+    args = parser.parse_args()
+
+    if args.local:
+        backend = LocalBackend(args.local, args.marker_column)
+    else:
+        backend = SupabaseBackend(args.marker_column)
+    exporter = ShardExporter(backend, args.lag, args.reconcile_every)
+
+    print("=" * 80)
+    print("WATCHING ARTWORKS FOR CHANGES")
+    print("=" * 80)
+    print(f"  Shards: {SHARDS_DIR}  Poll: {args.interval}s  "
+          f"Marker: {args.marker_column} (lag {args.lag:g}s)\n")
+
+    while True:
+        try:
+            dirty = exporter.poll()
+            if dirty:
+                stamp = datetime.now().strftime('%H:%M:%S')
+                print(f"OK {stamp} - Rewrote {', '.join(sorted(dirty))} "
+                      f"({exporter.meta['artworkCount']} artworks)")
+        except Exception as e:
+            print(f"X Poll failed: {e}")
+            if args.once:
+                raise
+        if args.once:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == '__main__':
+    main()
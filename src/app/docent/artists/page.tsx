@@ -6,6 +6,7 @@ import Link from 'next/link';
 import { Card, CardContent } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
 import { Button } from '@/components/ui/button';
+import { Sprite } from '@/components/Sprite';
 
 interface Artist {
   name: string;
@@ -114,10 +115,10 @@ export default function ArtistGallery() {
           ← Back to Artworks
         </Button>
         <div className="flex items-center gap-4">
-          <img
-            src="/docent-logo.png"
-            alt="Newfields/IMA Docents Logo"
-            className="h-16 w-auto"
+          <Sprite
+            name="docent-logo"
+            label="Newfields/IMA Docents Logo"
+            className="h-16"
           />
           <div>
             <h1 className="text-2xl font-bold" style={{ fontFamily: '"Times New Roman", Times, serif' }}>
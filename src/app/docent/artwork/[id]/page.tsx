@@ -5,6 +5,8 @@ import { useParams, useRouter } from 'next/navigation';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Artwork } from '@/lib/supabase';
+import { ArtworkImage } from '@/components/ArtworkImage';
+import { DeepZoomViewer } from '@/components/DeepZoomViewer';
 
 export default function ArtworkDetail() {
   const params = useParams();
@@ -79,10 +81,19 @@ export default function ArtworkDetail() {
       </Button>
 
       <Card>
-        {imageUrl && (
-          <div className="aspect-square overflow-hidden rounded-t-lg bg-muted">
-            <img src={imageUrl} alt={artwork.Title} className="w-full h-full object-contain" />
-          </div>
+        {artwork['Deep Zoom'] ? (
+          <DeepZoomViewer
+            tiles={artwork['Deep Zoom']}
+            label={artwork.Title}
+            className="aspect-square rounded-t-lg bg-muted"
+          />
+        ) : imageUrl && (
+          <ArtworkImage
+            artwork={artwork}
+            src={imageUrl}
+            className="aspect-square rounded-t-lg"
+            imgClassName="w-full h-full object-contain"
+          />
         )}
 
         <CardHeader>
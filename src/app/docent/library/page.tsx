@@ -6,6 +6,7 @@ import { Card, CardContent } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
 import { Button } from '@/components/ui/button';
 import { LibraryBook } from '@/lib/library';
+import { Sprite } from '@/components/Sprite';
 
 export default function LibraryBrowser() {
   const router = useRouter();
@@ -125,10 +126,10 @@ export default function LibraryBrowser() {
           ← Back to Artworks
         </Button>
         <div className="flex items-center gap-4">
-          <img
-            src="/docent-logo.png"
-            alt="Newfields/IMA Docents Logo"
-            className="h-16 w-auto"
+          <Sprite
+            name="docent-logo"
+            label="Newfields/IMA Docents Logo"
+            className="h-16"
           />
           <div>
             <h1 className="text-2xl font-bold" style={{ fontFamily: '"Times New Roman", Times, serif' }}>
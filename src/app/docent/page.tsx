@@ -8,6 +8,8 @@ import Link from 'next/link';
 import { useRouter } from 'next/navigation';
 import { Artwork } from '@/lib/supabase';
 import { getActiveCores } from '@/lib/cores';
+import { Sprite } from '@/components/Sprite';
+import { ArtworkImage } from '@/components/ArtworkImage';
 
 export default function DocentBrowser() {
   const router = useRouter();
@@ -358,10 +360,10 @@ export default function DocentBrowser() {
     <div className="container mx-auto p-4 max-w-7xl">
       {/* Header */}
       <div className="mb-2 flex items-center gap-1">
-        <img 
-          src="/docent-logo.png" 
-          alt="Newfields/IMA Docents Logo" 
-          className="h-38 w-auto"
+        <Sprite
+          name="docent-logo"
+          label="Newfields/IMA Docents Logo"
+          className="h-38"
         />
         <div style={{ fontFamily: '"Times New Roman", Times, serif' }}>
           <div className="text-[22px] leading-tight">NEWFIELDS / IMA</div>
@@ -652,13 +654,12 @@ export default function DocentBrowser() {
             <Link key={artwork.id} href={`/docent/artwork/${artwork.id}`}>
               <Card className="h-full hover:shadow-lg transition-shadow cursor-pointer">
                 {artwork.thumbnail ? (
-                  <div className="aspect-square overflow-hidden rounded-t-lg bg-muted">
-                    <img
-                      src={artwork.thumbnail}
-                      alt={artwork.Title}
-                      className="w-full h-full object-cover"
-                    />
-                  </div>
+                  <ArtworkImage
+                    artwork={artwork}
+                    src={artwork.thumbnail}
+                    className="aspect-square rounded-t-lg"
+                    imgClassName="w-full h-full object-cover"
+                  />
                 ) : (
                   <div className="aspect-square overflow-hidden rounded-t-lg bg-gray-100 flex items-center justify-center">
                     <div className="text-center p-8">
@@ -6,6 +6,7 @@ import Link from 'next/link';
 import { Card, CardContent } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
 import { Button } from '@/components/ui/button';
+import { Sprite } from '@/components/Sprite';
 
 interface Docent {
   id: number;
@@ -119,10 +120,10 @@ export default function DocentRoster() {
           ← Back to Artworks
         </Button>
         <div className="flex items-center gap-4">
-          <img
-            src="/docent-logo.png"
-            alt="Newfields/IMA Docents Logo"
-            className="h-16 w-auto"
+          <Sprite
+            name="docent-logo"
+            label="Newfields/IMA Docents Logo"
+            className="h-16"
           />
           <div>
             <h1 className="text-2xl font-bold" style={{ fontFamily: '"Times New Roman", Times, serif' }}>
@@ -3,6 +3,7 @@
 import { useRouter } from 'next/navigation';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
+import { Sprite } from '@/components/Sprite';
 
 interface StaffMember {
   name: string;
@@ -39,10 +40,10 @@ export default function StaffPage() {
           ← Back to Artworks
         </Button>
         <div className="flex items-center gap-4">
-          <img
-            src="/docent-logo.png"
-            alt="Newfields/IMA Docents Logo"
-            className="h-16 w-auto"
+          <Sprite
+            name="docent-logo"
+            label="Newfields/IMA Docents Logo"
+            className="h-16"
           />
           <div>
             <h1 className="text-2xl font-bold" style={{ fontFamily: '"Times New Roman", Times, serif' }}>
@@ -0,0 +1,46 @@
+'use client';
+
+import { useEffect, useState } from 'react';
+import { blurhashToDataURL } from '@/lib/blurhash';
+import { cn } from '@/lib/utils';
+import type { Artwork } from '@/lib/supabase';
+
+interface ArtworkImageProps {
+  artwork: Artwork;
+  src: string;
+  className?: string;
+  imgClassName?: string;
+}
+
+/**
+ * ArtworkImage Component
+ * Image in a fixed-size box that shows the harvested Dominant Color and
+ * BlurHash placeholder until the image itself has loaded.
+ */
+export function ArtworkImage({ artwork, src, className, imgClassName }: ArtworkImageProps) {
+  const hash = artwork['Image Blurhash'];
+  const [placeholder, setPlaceholder] = useState<string>();
+
+  // Decode after mount so server and client markup match
+  useEffect(() => {
+    setPlaceholder(blurhashToDataURL(hash));
+  }, [hash]);
+
+  return (
+    <div
+      className={cn('overflow-hidden bg-muted bg-cover bg-center', className)}
+      style={{
+        backgroundColor: artwork['Dominant Color'],
+        backgroundImage: placeholder ? `url(${placeholder})` : undefined,
+      }}
+    >
+      <img
+        src={src}
+        alt={artwork.Title}
+        loading="lazy"
+        decoding="async"
+        className={imgClassName}
+      />
+    </div>
+  );
+}
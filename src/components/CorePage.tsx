@@ -8,6 +8,8 @@ import Link from 'next/link';
 import { useRouter } from 'next/navigation';
 import { Artwork } from '@/lib/supabase';
 import { Core } from '@/lib/cores';
+import { Sprite } from '@/components/Sprite';
+import { ArtworkImage } from '@/components/ArtworkImage';
 
 interface CorePageProps {
   core: Core;
@@ -159,10 +161,10 @@ export default function CorePage({ core, allArtworks }: CorePageProps) {
       {/* Header with Core Badge */}
       <div className="mb-6">
         <div className="flex items-center gap-4 mb-4">
-          <img
-            src={core.badge}
-            alt={`${core.displayName} Badge`}
-            className="h-20 w-auto"
+          <Sprite
+            name={core.badge}
+            label={`${core.displayName} Badge`}
+            className="h-20"
           />
           <h1 className="text-[22px] leading-tight" style={{ fontFamily: '"Times New Roman", Times, serif' }}>
             {core.displayName.toUpperCase()} DOCENT REFERENCE
@@ -404,13 +406,12 @@ export default function CorePage({ core, allArtworks }: CorePageProps) {
             <Link key={artwork.id} href={`/docent/artwork/${artwork.id}`}>
               <Card className="h-full hover:shadow-lg transition-shadow cursor-pointer">
                 {artwork.thumbnail ? (
-                  <div className="aspect-square overflow-hidden rounded-t-lg bg-muted">
-                    <img
-                      src={artwork.thumbnail}
-                      alt={artwork.Title}
-                      className="w-full h-full object-cover"
-                    />
-                  </div>
+                  <ArtworkImage
+                    artwork={artwork}
+                    src={artwork.thumbnail}
+                    className="aspect-square rounded-t-lg"
+                    imgClassName="w-full h-full object-cover"
+                  />
                 ) : (
                   <div className="aspect-square overflow-hidden rounded-t-lg bg-gray-100 flex items-center justify-center">
                     <div className="text-center p-8">
@@ -0,0 +1,235 @@
+'use client';
+
+import { useEffect, useRef, useState } from 'react';
+import type { PointerEvent as ReactPointerEvent } from 'react';
+import type { DeepZoom } from '@/lib/supabase';
+import { cn } from '@/lib/utils';
+
+interface DeepZoomViewerProps {
+  tiles: DeepZoom;
+  label: string;
+  className?: string;
+}
+
+interface View {
+  scale: number; // screen pixels per image pixel
+  x: number;     // screen position of the image's top-left corner
+  y: number;
+}
+
+interface Size {
+  width: number;
+  height: number;
+}
+
+const MAX_ZOOM = 2;      // screen pixels per image pixel when fully zoomed in
+const WHEEL_STEP = 1.2;
+
+function levelSize(tiles: DeepZoom, level: number): Size {
+  const factor = 2 ** (tiles.levels - 1 - level);
+  return {
+    width: Math.max(1, Math.ceil(tiles.width / factor)),
+    height: Math.max(1, Math.ceil(tiles.height / factor)),
+  };
+}
+
+function fitScale(tiles: DeepZoom, size: Size): number {
+  return Math.min(size.width / tiles.width, size.height / tiles.height);
+}
+
+function clampView(view: View, tiles: DeepZoom, size: Size): View {
+  const fit = fitScale(tiles, size);
+  const scale = Math.min(Math.max(view.scale, fit), Math.max(fit, MAX_ZOOM));
+  const axis = (pos: number, extent: number, viewport: number) =>
+    extent <= viewport ? (viewport - extent) / 2 : Math.min(0, Math.max(viewport - extent, pos));
+  return {
+    scale,
+    x: axis(view.x, tiles.width * scale, size.width),
+    y: axis(view.y, tiles.height * scale, size.height),
+  };
+}
+
+function zoomAt(view: View, px: number, py: number, factor: number): View {
+  const scale = view.scale * factor;
+  return {
+    scale,
+    x: px - (px - view.x) * factor,
+    y: py - (py - view.y) * factor,
+  };
+}
+
+/**
+ * DeepZoomViewer Component
+ * Pan/zoom viewer for the DZI pyramids in public/tiles/ (scripts/generate-tiles.py).
+ * Only the tiles of the level matching the current zoom that intersect the
+ * viewport are requested; a single low-resolution tile fills in beneath them.
+ */
+export function DeepZoomViewer({ tiles, label, className }: DeepZoomViewerProps) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const pointers = useRef(new Map<number, { x: number; y: number }>());
+  const [size, setSize] = useState<Size | null>(null);
+  const [view, setView] = useState<View | null>(null);
+
+  // Fit the whole image whenever the viewer is (re)sized
+  useEffect(() => {
+    const element = containerRef.current;
+    if (!element) return;
+    const observer = new ResizeObserver(([entry]) => {
+      const next = { width: entry.contentRect.width, height: entry.contentRect.height };
+      if (!next.width || !next.height) return;
+      setSize(next);
+      setView(clampView({ scale: 0, x: 0, y: 0 }, tiles, next));
+    });
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, [tiles]);
+
+  // Wheel zoom needs a non-passive listener to stop the page scrolling
+  useEffect(() => {
+    const element = containerRef.current;
+    if (!element || !size) return;
+    const onWheel = (event: WheelEvent) => {
+      event.preventDefault();
+      const rect = element.getBoundingClientRect();
+      const factor = event.deltaY < 0 ? WHEEL_STEP : 1 / WHEEL_STEP;
+      setView((v) => v && clampView(zoomAt(v, event.clientX - rect.left, event.clientY - rect.top, factor), tiles, size));
+    };
+    element.addEventListener('wheel', onWheel, { passive: false });
+    return () => element.removeEventListener('wheel', onWheel);
+  }, [tiles, size]);
+
+  function localPoint(event: { clientX: number; clientY: number }) {
+    const rect = containerRef.current!.getBoundingClientRect();
+    return { x: event.clientX - rect.left, y: event.clientY - rect.top };
+  }
+
+  function onPointerDown(event: ReactPointerEvent<HTMLDivElement>) {
+    event.currentTarget.setPointerCapture(event.pointerId);
+    pointers.current.set(event.pointerId, localPoint(event));
+  }
+
+  function onPointerMove(event: ReactPointerEvent<HTMLDivElement>) {
+    const previous = pointers.current.get(event.pointerId);
+    if (!previous || !size) return;
+    const point = localPoint(event);
+    const others = [...pointers.current.entries()].filter(([id]) => id !== event.pointerId);
+    pointers.current.set(event.pointerId, point);
+
+    if (others.length === 0) {
+      setView((v) => v && clampView({ ...v, x: v.x + point.x - previous.x, y: v.y + point.y - previous.y }, tiles, size));
+    } else {
+      // Pinch: zoom by the change in finger distance around the other finger's midpoint
+      const other = others[0][1];
+      const before = Math.hypot(previous.x - other.x, previous.y - other.y);
+      const after = Math.hypot(point.x - other.x, point.y - other.y);
+      if (before > 0) {
+        const midX = (point.x + other.x) / 2;
+        const midY = (point.y + other.y) / 2;
+        setView((v) => v && clampView(zoomAt(v, midX, midY, after / before), tiles, size));
+      }
+    }
+  }
+
+  function onPointerUp(event: ReactPointerEvent<HTMLDivElement>) {
+    pointers.current.delete(event.pointerId);
+  }
+
+  function zoomCenter(factor: number) {
+    if (!size) return;
+    setView((v) => v && clampView(zoomAt(v, size.width / 2, size.height / 2, factor), tiles, size));
+  }
+
+  const base = tiles.url.replace(/\.dzi$/, '_files');
+  const maxLevel = tiles.levels - 1;
+  const images: { src: string; left: number; top: number; width: number; height: number }[] = [];
+
+  if (size && view) {
+    const dpr = typeof window === 'undefined' ? 1 : window.devicePixelRatio || 1;
+    const tileAt = (level: number, col: number, row: number) => {
+      const { width, height } = levelSize(tiles, level);
+      const toScreen = view.scale * 2 ** (maxLevel - level);
+      const x = col * tiles.tileSize - (col ? tiles.overlap : 0);
+      const y = row * tiles.tileSize - (row ? tiles.overlap : 0);
+      const x2 = Math.min(width, (col + 1) * tiles.tileSize + tiles.overlap);
+      const y2 = Math.min(height, (row + 1) * tiles.tileSize + tiles.overlap);
+      images.push({
+        src: `${base}/${level}/${col}_${row}.${tiles.format}`,
+        left: view.x + x * toScreen,
+        top: view.y + y * toScreen,
+        width: (x2 - x) * toScreen,
+        height: (y2 - y) * toScreen,
+      });
+    };
+
+    // Backdrop: the largest level that is still a single tile
+    let backdrop = maxLevel;
+    while (backdrop > 0) {
+      const { width, height } = levelSize(tiles, backdrop);
+      if (width <= tiles.tileSize && height <= tiles.tileSize) break;
+      backdrop--;
+    }
+    tileAt(backdrop, 0, 0);
+
+    const level = Math.min(maxLevel, Math.max(0, maxLevel + Math.ceil(Math.log2(view.scale * dpr))));
+    if (level > backdrop) {
+      const { width, height } = levelSize(tiles, level);
+      const toLevel = 2 ** (level - maxLevel) / view.scale;
+      const cols = Math.ceil(width / tiles.tileSize);
+      const rows = Math.ceil(height / tiles.tileSize);
+      const col0 = Math.max(0, Math.floor((-view.x * toLevel) / tiles.tileSize));
+      const col1 = Math.min(cols - 1, Math.floor(((size.width - view.x) * toLevel) / tiles.tileSize));
+      const row0 = Math.max(0, Math.floor((-view.y * toLevel) / tiles.tileSize));
+      const row1 = Math.min(rows - 1, Math.floor(((size.height - view.y) * toLevel) / tiles.tileSize));
+      for (let row = row0; row <= row1; row++) {
+        for (let col = col0; col <= col1; col++) {
+          tileAt(level, col, row);
+        }
+      }
+    }
+  }
+
+  return (
+    <div
+      ref={containerRef}
+      role="img"
+      aria-label={label}
+      className={cn('relative overflow-hidden touch-none select-none cursor-grab active:cursor-grabbing', className)}
+      onPointerDown={onPointerDown}
+      onPointerMove={onPointerMove}
+      onPointerUp={onPointerUp}
+      onPointerCancel={onPointerUp}
+      onDoubleClick={(event) => {
+        const point = localPoint(event);
+        if (size) setView((v) => v && clampView(zoomAt(v, point.x, point.y, 2), tiles, size));
+      }}
+    >
+      {images.map((image) => (
+        <img
+          key={image.src}
+          src={image.src}
+          alt=""
+          draggable={false}
+          className="absolute max-w-none pointer-events-none"
+          style={{ left: image.left, top: image.top, width: image.width, height: image.height }}
+        />
+      ))}
+      <div className="absolute bottom-2 right-2 flex gap-1" onPointerDown={(event) => event.stopPropagation()}>
+        {[
+          { label: 'Zoom in', text: '+', onClick: () => zoomCenter(WHEEL_STEP * WHEEL_STEP) },
+          { label: 'Zoom out', text: '−', onClick: () => zoomCenter(1 / (WHEEL_STEP * WHEEL_STEP)) },
+          { label: 'Fit image', text: '⤢', onClick: () => size && setView(clampView({ scale: 0, x: 0, y: 0 }, tiles, size)) },
+        ].map((control) => (
+          <button
+            key={control.label}
+            type="button"
+            aria-label={control.label}
+            onClick={control.onClick}
+            className="h-8 w-8 rounded bg-white/80 text-lg leading-none shadow hover:bg-white"
+          >
+            {control.text}
+          </button>
+        ))}
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,22 @@
+import { cn } from '@/lib/utils';
+
+interface SpriteProps {
+  name: string;
+  label: string;
+  className?: string;
+}
+
+/**
+ * Sprite Component
+ * Renders one frame of the badge/logo atlas (public/images/sprites.*).
+ * Set a height via className; the width follows the frame's aspect ratio.
+ */
+export function Sprite({ name, label, className }: SpriteProps) {
+  return (
+    <div
+      role="img"
+      aria-label={label}
+      className={cn('sprite', `sprite-${name}`, 'flex-shrink-0', className)}
+    />
+  );
+}
@@ -0,0 +1,105 @@
+/**
+ * BlurHash decoder for the image placeholders written by
+ * scripts/harvest-image-metadata.py ("Image Blurhash").
+ *
+ * Decodes to a tiny PNG data URL that is stretched behind the thumbnail
+ * while it loads. Results are memoized, so each hash is decoded once.
+ */
+
+const BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~';
+const PLACEHOLDER_SIZE = 32;
+
+const cache = new Map<string, string | undefined>();
+
+function decode83(value: string): number {
+  let result = 0;
+  for (const char of value) {
+    const digit = BASE83.indexOf(char);
+    if (digit < 0) return NaN;
+    result = result * 83 + digit;
+  }
+  return result;
+}
+
+function srgbToLinear(value: number): number {
+  const v = value / 255;
+  return v <= 0.04045 ? v / 12.92 : Math.pow((v + 0.055) / 1.055, 2.4);
+}
+
+function linearToSrgb(value: number): number {
+  const v = Math.max(0, Math.min(1, value));
+  return v <= 0.0031308
+    ? Math.round(v * 12.92 * 255)
+    : Math.round((1.055 * Math.pow(v, 1 / 2.4) - 0.055) * 255);
+}
+
+function signPow(value: number, exp: number): number {
+  return Math.sign(value) * Math.pow(Math.abs(value), exp);
+}
+
+/**
+ * Decode a BlurHash to RGBA pixels, or null if the hash is malformed.
+ */
+export function decodeBlurhash(hash: string, width: number, height: number): Uint8ClampedArray | null {
+  if (!hash || hash.length < 6) return null;
+  const sizeFlag = decode83(hash[0]);
+  const numX = (sizeFlag % 9) + 1;
+  const numY = Math.floor(sizeFlag / 9) + 1;
+  if (Number.isNaN(sizeFlag) || hash.length !== 4 + 2 * numX * numY) return null;
+
+  const maxValue = (decode83(hash[1]) + 1) / 166;
+  const dc = decode83(hash.slice(2, 6));
+  const colors: number[][] = [[srgbToLinear(dc >> 16), srgbToLinear((dc >> 8) & 255), srgbToLinear(dc & 255)]];
+  for (let i = 1; i < numX * numY; i++) {
+    const ac = decode83(hash.slice(4 + i * 2, 6 + i * 2));
+    const quant = (q: number) => signPow((q - 9) / 9, 2) * maxValue;
+    colors.push([quant(Math.floor(ac / 361)), quant(Math.floor(ac / 19) % 19), quant(ac % 19)]);
+  }
+  if (colors.some((c) => c.some(Number.isNaN))) return null;
+
+  const pixels = new Uint8ClampedArray(width * height * 4);
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let r = 0;
+      let g = 0;
+      let b = 0;
+      for (let j = 0; j < numY; j++) {
+        const basisY = Math.cos((Math.PI * y * j) / height);
+        for (let i = 0; i < numX; i++) {
+          const basis = Math.cos((Math.PI * x * i) / width) * basisY;
+          const color = colors[i + j * numX];
+          r += color[0] * basis;
+          g += color[1] * basis;
+          b += color[2] * basis;
+        }
+      }
+      const offset = 4 * (x + y * width);
+      pixels[offset] = linearToSrgb(r);
+      pixels[offset + 1] = linearToSrgb(g);
+      pixels[offset + 2] = linearToSrgb(b);
+      pixels[offset + 3] = 255;
+    }
+  }
+  return pixels;
+}
+
+/**
+ * Decode a BlurHash to a PNG data URL; undefined on the server or for a bad hash.
+ */
+export function blurhashToDataURL(hash?: string): string | undefined {
+  if (!hash || typeof document === 'undefined') return undefined;
+  if (cache.has(hash)) return cache.get(hash);
+
+  let url: string | undefined;
+  const pixels = decodeBlurhash(hash, PLACEHOLDER_SIZE, PLACEHOLDER_SIZE);
+  const canvas = document.createElement('canvas');
+  const ctx = canvas.getContext('2d');
+  if (pixels && ctx) {
+    canvas.width = PLACEHOLDER_SIZE;
+    canvas.height = PLACEHOLDER_SIZE;
+    ctx.putImageData(new ImageData(pixels, PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), 0, 0);
+    url = canvas.toDataURL();
+  }
+  cache.set(hash, url);
+  return url;
+}
@@ -7,7 +7,7 @@ export interface Core {
   id: string;
   name: string;
   displayName: string;
-  badge: string;
+  badge: string; // Sprite name in the badge atlas (see components/Sprite)
   collections: string[];
   description: string;
 }
@@ -17,7 +17,7 @@ export const cores: Record<string, Core> = {
     id: 'american',
     name: 'american-core',
     displayName: 'American Core',
-    badge: '/images/badges/american-core.png',
+    badge: 'american-core',
     collections: [
       'American Painting & Sculpture 1800–1945',
       'American Painting & Sculpture Before 1800',
@@ -30,7 +30,7 @@ export const cores: Record<string, Core> = {
     id: 'contemporary',
     name: 'contemporary-core',
     displayName: 'Contemporary Core',
-    badge: '/images/badges/contemporary-core.png',
+    badge: 'contemporary-core',
     collections: ['Contemporary'],
     description: 'Contemporary art from the late 20th century to present'
   },
@@ -38,7 +38,7 @@ export const cores: Record<string, Core> = {
     id: 'african',
     name: 'african-core',
     displayName: 'African Core',
-    badge: '/images/badges/african-core.png',
+    badge: 'african-core',
     collections: [], // To be added when African collection is imported
     description: 'African art and cultural artifacts'
   },
@@ -46,7 +46,7 @@ export const cores: Record<string, Core> = {
     id: 'asian',
     name: 'asian-core',
     displayName: 'Asian Core',
-    badge: '/images/badges/asian-core.png',
+    badge: 'asian-core',
     collections: [], // To be added when Asian collection is imported
     description: 'Asian art and cultural heritage'
   },
@@ -54,7 +54,7 @@ export const cores: Record<string, Core> = {
     id: 'design-decorative',
     name: 'design-decorative-core',
     displayName: 'Design & Decorative Arts Core',
-    badge: '/images/badges/design-decorative-core.png',
+    badge: 'design-decorative-core',
     collections: [], // To be added when Design & Decorative Arts collection is imported
     description: 'Design, decorative arts, and functional objects'
   },
@@ -62,7 +62,7 @@ export const cores: Record<string, Core> = {
     id: 'european',
     name: 'european-core',
     displayName: 'European Core',
-    badge: '/images/badges/european-core.png',
+    badge: 'european-core',
     collections: [], // To be added when European collection is imported
     description: 'European art from medieval to modern periods'
   }
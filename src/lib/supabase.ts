@@ -41,11 +41,27 @@ export interface Artwork {
   'Image'?: string;
   'Image Upload'?: string;
   'Image URL'?: string;
+  'Dominant Color'?: string;
+  'Image Blurhash'?: string;
+  'Deep Zoom'?: DeepZoom;
   thumbnail?: string;
   imageUrl?: string;
   'Online Resources'?: OnlineResource[];
 }
 
+/**
+ * Deep Zoom tile pyramid written by scripts/generate-tiles.py
+ */
+export interface DeepZoom {
+  url: string;
+  width: number;
+  height: number;
+  tileSize: number;
+  overlap: number;
+  format: string;
+  levels: number;
+}
+
 export interface OnlineResource {
   type: string;
   title: string;
@@ -96,6 +112,9 @@ export async function fetchArtworks(): Promise<Artwork[]> {
       'Image': record.Image,
       'Image Upload': record['Image Upload'],
       'Image URL': record['Image URL'],
+      'Dominant Color': record['Dominant Color'],
+      'Image Blurhash': record['Image Blurhash'],
+      'Deep Zoom': record['Deep Zoom'],
       thumbnail: record.Image?.includes('supabase.co') ? record.Image : (record['Image Upload'] || record['Image URL'] || record.Image),
       imageUrl: record.Image?.includes('supabase.co') ? record.Image : (record['Image Upload'] || record['Image URL'] || record.Image),
       'Online Resources': record['Online Resources'] || []
@@ -153,6 +172,9 @@ export async function fetchArtworkById(id: string): Promise<Artwork | null> {
       'Image': data.Image,
       'Image Upload': data['Image Upload'],
       'Image URL': data['Image URL'],
+      'Dominant Color': data['Dominant Color'],
+      'Image Blurhash': data['Image Blurhash'],
+      'Deep Zoom': data['Deep Zoom'],
       thumbnail: data.Image?.includes('supabase.co') ? data.Image : (data['Image Upload'] || data['Image URL'] || data.Image),
       imageUrl: data.Image?.includes('supabase.co') ? data.Image : (data['Image Upload'] || data['Image URL'] || data.Image),
       'Online Resources': data['Online Resources'] || []
@@ -0,0 +1,28 @@
+-- Change marker for scripts/watch-artworks.py
+--
+-- Adds "Artworks".updated_at, bumped on every UPDATE by a trigger, plus an
+-- index so the watcher's `updated_at >= <marker - lag>` poll stays cheap.
+-- now() is the transaction start time, so a slow transaction can commit a
+-- row stamped earlier than the newest marker; the watcher's --lag window
+-- re-reads that span to pick such rows up.
+
+alter table "Artworks"
+  add column if not exists updated_at timestamptz not null default now();
+
+create index if not exists artworks_updated_at_idx on "Artworks" (updated_at);
+
+create or replace function set_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+  new.updated_at = now();
+  return new;
+end;
+$$;
+
+drop trigger if exists artworks_set_updated_at on "Artworks";
+create trigger artworks_set_updated_at
+  before update on "Artworks"
+  for each row
+  execute function set_updated_at();
@@ -0,0 +1,8 @@
+-- Tile-set metadata for scripts/generate-tiles.py
+--
+-- "Deep Zoom" holds the pyramid written under public/tiles/<accession>/:
+-- {url, width, height, tileSize, overlap, format, levels, tiles, sourceHash}.
+-- The artwork detail page reads it to open the tiled viewer.
+
+alter table "Artworks"
+  add column if not exists "Deep Zoom" jsonb;
@@ -0,0 +1,11 @@
+-- Image metadata for scripts/harvest-image-metadata.py
+--
+-- Dimensions come from the file header; "Dominant Color" (#rrggbb) and
+-- "Image Blurhash" are painted by components/ArtworkImage.tsx while the
+-- image itself loads.
+
+alter table "Artworks"
+  add column if not exists "Image Width" integer,
+  add column if not exists "Image Height" integer,
+  add column if not exists "Dominant Color" text,
+  add column if not exists "Image Blurhash" text;
@@ -0,0 +1,42 @@
+import json
+import os
+import subprocess
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'upload-images.py')
+
+
+def run_upload(cwd, *args):
+    result = subprocess.run([sys.executable, os.path.abspath(SCRIPT), *args],
+                            cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def test_identical_files_upload_once(tmp_path):
+    images = tmp_path / 'images'
+    images.mkdir()
+    for name in ('a.jpg', 'b.jpg', 'c.jpg'):
+        (images / name).write_bytes(b'same image bytes')
+
+    out = run_upload(tmp_path, 'images', '--local-dir', 'store', '--workers', '3')
+
+    assert 'Uploaded: 1 files' in out
+    assert 'Already stored (deduplicated): 2' in out
+    assert len(os.listdir(tmp_path / 'store' / 'by-hash')) == 1
+
+    manifest = json.loads((tmp_path / '.upload-manifest.json').read_text())
+    entries = next(iter(manifest['targets'].values()))
+    assert len({entry['key'] for entry in entries.values()}) == 1
+    assert len(entries) == 3
+
+
+def test_rerun_skips_unchanged_files(tmp_path):
+    images = tmp_path / 'images'
+    images.mkdir()
+    (images / 'a.jpg').write_bytes(b'one')
+
+    run_upload(tmp_path, 'images', '--local-dir', 'store')
+    out = run_upload(tmp_path, 'images', '--local-dir', 'store')
+
+    assert 'Uploaded: 0 files' in out
+    assert 'Unchanged (manifest): 1' in out